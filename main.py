@@ -18,12 +18,23 @@ from __future__ import annotations
 
 import os
 import re
+import sys
 import csv
-import glob
+import string
 import json
+import logging
+import hashlib
 import html
+import io
+import operator
+import mmap
+import multiprocessing
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple, Any
 
 import tkinter as tk
@@ -38,6 +49,14 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 from reportlab.lib.utils import ImageReader
 
+# 任意: orjson があれば manual_overrides.json の読み書きに使う（無ければ標準の json）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
 
 # -----------------------------
 # Settings (Contest / Display)
@@ -72,7 +91,7 @@ DEFAULT_ENTRY_BG = "entry_bg.png"       # 参加証
 # Data models
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class QsoRecord:
     date: str = ""
     time: str = ""
@@ -85,8 +104,27 @@ class QsoRecord:
     dup: bool = False
     raw: str = ""
 
-
-@dataclass
+    # 二重交信判定キー（生成時に一度だけ正規化）
+    band_key: str = field(default="", init=False, repr=False)
+    mode_key: str = field(default="", init=False, repr=False)
+    call_key: str = field(default="", init=False, repr=False)
+    # マルチ判定用の正規化済み受信ナンバー
+    rcvd_exch_canon: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # バンド/モード/ナンバーは種類が少ないので intern して同じ文字列オブジェクトを共有する
+        intern = sys.intern
+        self.band_mhz = intern(self.band_mhz)
+        self.mode = intern(self.mode)
+        self.sent_exch = intern(self.sent_exch)
+        self.rcvd_exch = intern(self.rcvd_exch)
+        self.band_key = intern(self.band_mhz.strip())
+        self.mode_key = intern(self.mode.strip().upper())
+        self.call_key = self.worked_call.strip().upper()
+        self.rcvd_exch_canon = intern(_canon_exchange(self.rcvd_exch))
+
+
+@dataclass(slots=True)
 class StationEntry:
     callsign: str = ""
     category: str = ""
@@ -126,6 +164,9 @@ class StationEntry:
     # ★追加: チェックログ判定
     is_checklog: bool = False
 
+    # 順位付け用 (total, pts, mult, qso) のキャッシュ（recalc_entry で破棄）
+    _rank_metrics_cache: Optional[Tuple[int, int, int, int]] = field(default=None, init=False, repr=False, compare=False)
+
 
 # -----------------------------
 # Utility: normalize / parsing helpers
@@ -148,25 +189,48 @@ PREFS = [
 HYPHEN_CHARS = r"[\-‐-‒–—―−ー－]"
 HOME_MARKERS = ("常置場所", "同上", "自宅", "住所", "自局")
 
+# よく使う正規表現はモジュール読込時に一度だけコンパイル
+_RE_SPACES = re.compile(r"[ \t]+")
+_RE_NONDIGIT = re.compile(r"[^\d]")
+# ASCII の数字以外を削除する str.translate 用テーブル
+_ASCII_NONDIGIT_DELETE = {c: None for c in range(128) if not chr(c).isdecimal()}
+_RE_DIGITS = re.compile(r"\d+")
+_RE_DECIMAL = re.compile(r"\d+(\.\d+)?")
+_RE_DATE = re.compile(r"\d{4}[-/]\d{2}[-/]\d{2}")
+_RE_CALL_CHARS = re.compile(r"[A-Z0-9/]+")
+_RE_CALL_HAS_ALPHA = re.compile(r"[A-Z]")
+
 
 def _clean(s: str) -> str:
     return (s or "").replace("\r\n", "\n").replace("\r", "\n")
 
 def _strip_tags_text(x: str) -> str:
-    return re.sub(r"[ \t]+", " ", (x or "").strip()).strip()
+    return _RE_SPACES.sub(" ", (x or "").strip()).strip()
+
+@lru_cache(maxsize=256)
+def _tag_re(tag: str) -> re.Pattern:
+    return re.compile(rf"<{re.escape(tag)}>(.*?)</{re.escape(tag)}>", re.DOTALL | re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def _attr_open_re(tag: str) -> re.Pattern:
+    return re.compile(rf"<{re.escape(tag)}\b([^>]*)>", re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def _attr_value_re(attr: str) -> re.Pattern:
+    return re.compile(rf'{re.escape(attr)}\s*=\s*(".*?"|\'.*?\'|[^\s>]+)', re.IGNORECASE)
 
 def _find_tag(text: str, tag: str) -> Optional[str]:
-    m = re.search(rf"<{re.escape(tag)}>(.*?)</{re.escape(tag)}>", text, flags=re.DOTALL | re.IGNORECASE)
+    m = _tag_re(tag).search(text)
     if not m:
         return None
     return _strip_tags_text(m.group(1))
 
 def _find_attr(text: str, tag: str, attr: str) -> Optional[str]:
-    m = re.search(rf"<{re.escape(tag)}\b([^>]*)>", text, flags=re.IGNORECASE)
+    m = _attr_open_re(tag).search(text)
     if not m:
         return None
     attrs = m.group(1)
-    m2 = re.search(rf'{re.escape(attr)}\s*=\s*(".*?"|\'.*?\'|[^\s>]+)', attrs, flags=re.IGNORECASE)
+    m2 = _attr_value_re(attr).search(attrs)
     if not m2:
         return None
     v = m2.group(1).strip()
@@ -205,13 +269,22 @@ def _safe_int(x: Any, default: int = 0) -> int:
     except:
         return default
 
+def _digits_only(s: str) -> str:
+    # _RE_NONDIGIT.sub("", s) と同じ（\d = Unicode の Nd = isdecimal）。よくある形は正規表現を使わない
+    if s.isdecimal():
+        return s
+    if s.isascii():
+        return s.translate(_ASCII_NONDIGIT_DELETE)
+    return _RE_NONDIGIT.sub("", s)
+
+@lru_cache(maxsize=8192)
 def _canon_exchange(exch: str) -> str:
     if exch is None:
         return ""
     s = str(exch).strip()
     if s in ("", "-"):
         return ""
-    s = re.sub(r"[^\d]", "", s)
+    s = _digits_only(s)
     if s == "":
         return ""
     try:
@@ -219,21 +292,25 @@ def _canon_exchange(exch: str) -> str:
     except:
         return s
 
-def _extract_exchange_from_token(tok: str) -> str:
+def _canon_exchange_token(tok: str) -> str:
+    """
+    ログの1トークン（例: "5913", "59", "013"）から受信/送信ナンバーを取り出して正規化。
+    RST（59等）の接頭を外し、数字だけを残して先頭0を落とす（1回の置換で済ませる）。
+    """
     if tok is None:
         return ""
     s = str(tok).strip()
-    if s == "" or s == "-":
+    if s == "" or s == "-" or s in RST_PREFIXES:
         return ""
-    if s in RST_PREFIXES:
+    if len(s) > 2 and s[:2] in RST_PREFIXES:
+        s = s[2:]
+    s = _digits_only(s)
+    if s == "":
         return ""
-    for rst in RST_PREFIXES:
-        if s.startswith(rst) and len(s) > len(rst):
-            tail = s[len(rst):]
-            tail = re.sub(r"[^\d]", "", tail)
-            return tail
-    s = re.sub(r"[^\d]", "", s)
-    return s
+    try:
+        return str(int(s))
+    except:
+        return s
 
 def _parse_band_mhz(tok: str) -> str:
     if tok is None:
@@ -242,11 +319,12 @@ def _parse_band_mhz(tok: str) -> str:
     s = s.replace("MHz", "").replace("mhz", "").strip()
     return s
 
+@lru_cache(maxsize=256)
 def _canon_band_token(tok: str) -> str:
     s = _parse_band_mhz(tok).strip()
     if s == "":
         return ""
-    if re.fullmatch(r"\d+(\.\d+)?", s):
+    if _RE_DECIMAL.fullmatch(s):
         try:
             f = float(s)
             if abs(f - round(f)) < 1e-9:
@@ -260,18 +338,21 @@ def _parse_time(tok: str) -> str:
     if not tok:
         return ""
     s = str(tok).strip()
-    if re.fullmatch(r"\d{2}:\d{2}", s):
-        return s
-    if re.fullmatch(r"\d{4}", s):
+    # "HHMM" だけを "HH:MM" に（"HH:MM" やその他はそのまま）。正規表現は使わない
+    if len(s) == 4 and s.isdecimal():
         return s[:2] + ":" + s[2:]
     return s
 
 def _looks_date(s: str) -> bool:
-    return bool(re.fullmatch(r"\d{4}[-/]\d{2}[-/]\d{2}", (s or "").strip()))
+    return bool(_RE_DATE.fullmatch((s or "").strip()))
 
 def _looks_time(s: str) -> bool:
     s = (s or "").strip()
-    return bool(re.fullmatch(r"\d{2}:\d{2}", s) or re.fullmatch(r"\d{4}", s))
+    # \d{2}:\d{2} または \d{4}（\d は isdecimal と同じ）
+    n = len(s)
+    if n == 5:
+        return s[2] == ":" and s[:2].isdecimal() and s[3:].isdecimal()
+    return n == 4 and s.isdecimal()
 
 def _clean_callsign(call: str) -> str:
     if not call:
@@ -282,15 +363,35 @@ def _looks_callsign(tok: str) -> bool:
     s = (tok or "").strip().upper()
     if not s:
         return False
-    if not re.fullmatch(r"[A-Z0-9/]+", s):
+    if not _RE_CALL_CHARS.fullmatch(s):
         return False
-    return bool(re.search(r"[A-Z]", s))
+    return bool(_RE_CALL_HAS_ALPHA.search(s))
 
 
 # -----------------------------
 # OPPLACE normalization (強化版)
 # -----------------------------
 
+_RE_POSTAL1 = re.compile(rf"〒\s*\d{{3}}\s*{HYPHEN_CHARS}\s*\d{{4}}\s*")
+_RE_POSTAL2 = re.compile(r"〒\s*\d{3}\s*\d{4}\s*")
+_RE_POSTAL3 = re.compile(rf"\b\d{{3}}\s*{HYPHEN_CHARS}\s*\d{{4}}\b")
+_RE_POSTAL4 = re.compile(r"\b\d{3}\s*\d{4}\b")
+# 郵便番号の4パターンはどれも「数字3桁」を含む → 無ければ置換自体を省略できる
+_RE_POSTAL_HINT = re.compile(r"\d{3}")
+# 都道府県名は1本の選択パターンで除去（pyahocorasick も試したが、住所程度の短い文字列では
+# Python側の一致処理が重く、この正規表現の方が 1.5〜3倍速かったので採用していない）
+_RE_PREFS = re.compile("(?:" + "|".join(re.escape(p) for p in PREFS) + ")")
+
+_RE_CITY_WARD = re.compile(r"^(.+?市.+?区)")
+_RE_CITY = re.compile(r"^(.{2,}?市)")
+_RE_SAITAMA_WARD_HEAD = re.compile(r"^(さいたま市.+?区)")
+_RE_SAITAMA_WARD = re.compile(r"(さいたま市.+?区)")
+_RE_WARD = re.compile(r"^(.{2,}?区)")
+_RE_GUN_TOWN = re.compile(r"^.*?郡(.{1,}?町)")
+_RE_GUN_VILLAGE = re.compile(r"^.*?郡(.{1,}?村)")
+_RE_TOWN = re.compile(r"^(.{2,}?町)")
+_RE_VILLAGE = re.compile(r"^(.{2,}?村)")
+
 def _opplace_means_home(opplace_raw: str) -> bool:
     t = (opplace_raw or "").strip()
     if not t:
@@ -301,54 +402,55 @@ def _strip_postal_and_prefs(s: str) -> str:
     s = (s or "").strip()
     if not s:
         return ""
-    s = re.sub(rf"〒\s*\d{{3}}\s*{HYPHEN_CHARS}\s*\d{{4}}\s*", " ", s)
-    s = re.sub(r"〒\s*\d{3}\s*\d{4}\s*", " ", s)
-    s = re.sub(rf"\b\d{{3}}\s*{HYPHEN_CHARS}\s*\d{{4}}\b", " ", s)
-    s = re.sub(r"\b\d{3}\s*\d{4}\b", " ", s)
-    for p in PREFS:
-        s = s.replace(p, " ")
-    s = re.sub(r"[ \t]+", " ", s).strip()
+    if _RE_POSTAL_HINT.search(s):
+        s = _RE_POSTAL1.sub(" ", s)
+        s = _RE_POSTAL2.sub(" ", s)
+        s = _RE_POSTAL3.sub(" ", s)
+        s = _RE_POSTAL4.sub(" ", s)
+    s = _RE_PREFS.sub(" ", s)
+    s = _RE_SPACES.sub(" ", s).strip()
     return s
 
+@lru_cache(maxsize=4096)
 def normalize_opplace_any(text: str, fallback_text: str = "") -> str:
     s = _strip_postal_and_prefs(text)
     if not s:
         return ""
 
-    m = re.match(r"^(.+?市.+?区)", s)
+    m = _RE_CITY_WARD.match(s)
     if m:
         return m.group(1).strip()
 
-    m = re.match(r"^(.{2,}?市)", s)
+    m = _RE_CITY.match(s)
     if m:
         city = m.group(1).strip()
         if city == "さいたま市":
-            m2 = re.match(r"^(さいたま市.+?区)", s)
+            m2 = _RE_SAITAMA_WARD_HEAD.match(s)
             if m2:
                 return m2.group(1).strip()
             fb = _strip_postal_and_prefs(fallback_text)
-            m3 = re.search(r"(さいたま市.+?区)", fb)
+            m3 = _RE_SAITAMA_WARD.search(fb)
             if m3:
                 return m3.group(1).strip()
             return "さいたま市（区不明）"
         return city
 
-    m = re.match(r"^(.{2,}?区)", s)
+    m = _RE_WARD.match(s)
     if m:
         return m.group(1).strip()
 
-    m = re.match(r"^.*?郡(.{1,}?町)", s)
+    m = _RE_GUN_TOWN.match(s)
     if m:
         return m.group(1).strip()
-    m = re.match(r"^.*?郡(.{1,}?村)", s)
+    m = _RE_GUN_VILLAGE.match(s)
     if m:
         return m.group(1).strip()
 
-    m = re.match(r"^(.{2,}?町)", s)
+    m = _RE_TOWN.match(s)
     if m:
         return m.group(1).strip()
 
-    m = re.match(r"^(.{2,}?村)", s)
+    m = _RE_VILLAGE.match(s)
     if m:
         return m.group(1).strip()
 
@@ -359,19 +461,24 @@ def normalize_opplace_any(text: str, fallback_text: str = "") -> str:
 # LOGSHEET parsers
 # -----------------------------
 
+def _has_zero_tail(line: str) -> bool:
+    # 行末が「空白 + 0」か（旧: re.search(r"\s0\s*$", line)）
+    t = line.rstrip()
+    return len(t) >= 2 and t[-1] == "0" and t[-2].isspace()
+
 def _take_pts_from_tail(tokens: List[str], raw_line: str) -> Tuple[int, List[str]]:
     if not tokens:
         return (2, tokens)
     tail = tokens[-1].replace(",", "").strip()
-    if re.fullmatch(r"\d+", tail):
+    if _RE_DIGITS.fullmatch(tail):
         return (int(tail), tokens[:-1])
 
     if len(tokens) >= 2 and tokens[-1].lower() in ("dupe", "dup"):
         tail2 = tokens[-2].replace(",", "").strip()
-        if re.fullmatch(r"\d+", tail2):
+        if _RE_DIGITS.fullmatch(tail2):
             return (int(tail2), tokens[:-2])
 
-    if re.search(r"\s0\s*$", raw_line):
+    if _has_zero_tail(raw_line):
         return (0, tokens)
 
     return (2, tokens)
@@ -431,14 +538,11 @@ def parse_logsheet_ctestwin(lines: List[str]) -> List[QsoRecord]:
             if len(rest) >= 2:
                 rcvd_exch = rest[1]
 
-        sent_exch_num = _extract_exchange_from_token(sent_exch)
-        rcvd_exch_num = _extract_exchange_from_token(rcvd_exch)
-
-        sent_exch = _canon_exchange(sent_exch_num)
-        rcvd_exch = _canon_exchange(rcvd_exch_num)
+        sent_exch = _canon_exchange_token(sent_exch)
+        rcvd_exch = _canon_exchange_token(rcvd_exch)
 
         if pts <= 0:
-            if re.search(r"\s0\s*$", s) or "dupe" in s.lower() or "dup" in s.lower():
+            if _has_zero_tail(s) or "dupe" in s.lower() or "dup" in s.lower():
                 pts = 0
             else:
                 pts = 2
@@ -477,8 +581,8 @@ def parse_logsheet_hltst(lines: List[str]) -> List[QsoRecord]:
             call = _clean_callsign(parts[4])
             base = 5
 
-        sent_exch = _canon_exchange(_extract_exchange_from_token(parts[base+1])) if len(parts) > base+1 else ""
-        rcvd_exch = _canon_exchange(_extract_exchange_from_token(parts[base+3])) if len(parts) > base+3 else ""
+        sent_exch = _canon_exchange_token(parts[base+1]) if len(parts) > base+1 else ""
+        rcvd_exch = _canon_exchange_token(parts[base+3]) if len(parts) > base+3 else ""
 
         pt = 0
         if len(parts) > base+5:
@@ -487,7 +591,7 @@ def parse_logsheet_hltst(lines: List[str]) -> List[QsoRecord]:
             pt = _safe_int(parts[-1], 0)
 
         if pt <= 0:
-            if re.search(r"\s0\s*$", s):
+            if _has_zero_tail(s):
                 pt = 0
             else:
                 pt = 2
@@ -516,13 +620,13 @@ def parse_logsheet_zlog(lines: List[str]) -> List[QsoRecord]:
         time = _parse_time(parts[1])
         call = _clean_callsign(parts[2])
 
-        sent_exch = _canon_exchange(_extract_exchange_from_token(parts[4]))
-        rcvd_exch = _canon_exchange(_extract_exchange_from_token(parts[6]))
+        sent_exch = _canon_exchange_token(parts[4])
+        rcvd_exch = _canon_exchange_token(parts[6])
         band = _parse_band_mhz(parts[9])
         mode = parts[10]
         pt = _safe_int(parts[11], 0)
         if pt <= 0:
-            if re.search(r"\s0\s*$", s):
+            if _has_zero_tail(s):
                 pt = 0
             else:
                 pt = 2
@@ -545,18 +649,43 @@ def parse_logsheet_custom_csv(lines: List[str]) -> List[QsoRecord]:
         has_header = ("Date" in sample or "DATE" in sample) and ("Callsign" in sample or "CALLSIGN" in sample)
 
         if has_header:
-            reader = csv.DictReader(data_lines)
+            reader = csv.reader(data_lines)
+            header = next(reader)
+            # 列名→列番号（同名の列は DictReader と同じく後勝ち）
+            idx = {h: i for i, h in enumerate(header)}
+            fields = list(dict.fromkeys(header))
+
+            def cols_of(*names: str) -> List[int]:
+                return [idx[n] for n in names if n in idx]
+
+            c_date = cols_of("Date", "DATE")
+            c_time = cols_of("Time", "TIME")
+            c_call = cols_of("Callsign", "CALLSIGN")
+            c_sent = cols_of("Sent", "SENT")
+            c_rcvd = cols_of("Rcvd", "RCVD")
+            c_mhz = cols_of("MHz", "MHZ", "Band", "BAND")
+            c_mode = cols_of("Mode", "MODE")
+            c_pts = cols_of("Pts", "PTS")
+            c_rmks = cols_of("Rmks")
+
+            def pick(row: List[str], cols: List[int]) -> str:
+                n = len(row)
+                for i in cols:
+                    if i < n and row[i]:
+                        return row[i]
+                return ""
+
             for row in reader:
                 if not row:
                     continue
-                date = (row.get("Date") or row.get("DATE") or "").strip()
-                time = (row.get("Time") or row.get("TIME") or "").strip()
-                call = (row.get("Callsign") or row.get("CALLSIGN") or "").strip()
-                sent = (row.get("Sent") or row.get("SENT") or "").strip()
-                rcvd = (row.get("Rcvd") or row.get("RCVD") or "").strip()
-                mhz = (row.get("MHz") or row.get("MHZ") or row.get("Band") or row.get("BAND") or "").strip()
-                mode = (row.get("Mode") or row.get("MODE") or "").strip()
-                pts_s = (row.get("Pts") or row.get("PTS") or "").strip()
+                date = pick(row, c_date).strip()
+                time = pick(row, c_time).strip()
+                call = pick(row, c_call).strip()
+                sent = pick(row, c_sent).strip()
+                rcvd = pick(row, c_rcvd).strip()
+                mhz = pick(row, c_mhz).strip()
+                mode = pick(row, c_mode).strip()
+                pts_s = pick(row, c_pts).strip()
 
                 if not _looks_date(date):
                     continue
@@ -566,16 +695,20 @@ def parse_logsheet_custom_csv(lines: List[str]) -> List[QsoRecord]:
                 mode = mode or "AM"
                 call = _clean_callsign(call)
 
-                sent_exch = _canon_exchange(_extract_exchange_from_token(sent))
-                rcvd_exch = _canon_exchange(_extract_exchange_from_token(rcvd))
+                sent_exch = _canon_exchange_token(sent)
+                rcvd_exch = _canon_exchange_token(rcvd)
                 pt = _safe_int(pts_s, 0)
                 if pt <= 0:
-                    pt = 0 if pt == 0 and (str(row.get("Rmks", "")).lower().find("dupe") >= 0) else (2 if pt == 0 else pt)
+                    pt = 0 if pt == 0 and (pick(row, c_rmks).lower().find("dupe") >= 0) else (2 if pt == 0 else pt)
+
+                if len(row) > len(header):
+                    # 列数がヘッダより多い行は、DictReader 時代と同様に下の簡易パースへ回す
+                    raise ValueError("CSV row has more columns than header")
 
                 out.append(QsoRecord(
                     date=date, time=time, band_mhz=band, mode=mode,
                     worked_call=call, sent_exch=sent_exch, rcvd_exch=rcvd_exch,
-                    pts=pt, dup=False, raw=",".join([v for v in row.values() if v is not None])
+                    pts=pt, dup=False, raw=",".join([row[idx[h]] for h in fields if idx[h] < len(row)])
                 ))
             return out
 
@@ -596,7 +729,7 @@ def parse_logsheet_custom_csv(lines: List[str]) -> List[QsoRecord]:
             mode = (cols[6] if len(cols) > 6 else "AM") or "AM"
             pt = _safe_int(cols[8] if len(cols) > 8 else (cols[-1] if cols else "2"), 0)
             if pt <= 0:
-                if re.search(r",0\s*$", raw) or "dupe" in raw.lower():
+                if raw.rstrip().endswith(",0") or "dupe" in raw.lower():
                     pt = 0
                 else:
                     pt = 2
@@ -604,8 +737,8 @@ def parse_logsheet_custom_csv(lines: List[str]) -> List[QsoRecord]:
             out.append(QsoRecord(
                 date=date, time=time, band_mhz=band, mode=mode,
                 worked_call=call,
-                sent_exch=_canon_exchange(_extract_exchange_from_token(sent)),
-                rcvd_exch=_canon_exchange(_extract_exchange_from_token(rcvd)),
+                sent_exch=_canon_exchange_token(sent),
+                rcvd_exch=_canon_exchange_token(rcvd),
                 pts=pt, dup=False, raw=raw
             ))
         return out
@@ -655,14 +788,30 @@ def parse_logsheet_generic(lines: List[str], logsheet_type: str) -> List[QsoReco
 # Submission parser (SUMMARYSHEET + LOGSHEET)
 # -----------------------------
 
+_RE_SUMMARY = re.compile(r"(<SUMMARYSHEET\b.*?</SUMMARYSHEET>)", re.DOTALL | re.IGNORECASE)
+_RE_LOGSHEET = re.compile(r"(<LOGSHEET\b.*?</LOGSHEET>)", re.DOTALL | re.IGNORECASE)
+_RE_LOGSHEET_OPEN = re.compile(r"^<LOGSHEET\b[^>]*>", re.IGNORECASE)
+_RE_LOGSHEET_CLOSE = re.compile(r"</LOGSHEET>\s*$", re.IGNORECASE)
+_RE_SCORE_50 = re.compile(r"<SCORE\b[^>]*BAND\s*=\s*(\"|')?50MHz\1?[^>]*>(.*?)</SCORE>", re.DOTALL | re.IGNORECASE)
+_RE_SCORE_TOTAL = re.compile(r"<SCORE\b[^>]*BAND\s*=\s*(\"|')?TOTAL\1?[^>]*>(.*?)</SCORE>", re.DOTALL | re.IGNORECASE)
+
 def split_submission_blocks(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     t = _clean(text)
 
-    sm = re.search(r"(<SUMMARYSHEET\b.*?</SUMMARYSHEET>)", t, flags=re.DOTALL | re.IGNORECASE)
-    summary_block = sm.group(1) if sm else None
+    # 開始タグの位置を str.find で先に探し、無ければ正規表現を回さない／あればそこから探す
+    # （upper() で長さが変わる文字を含む場合は位置がずれるので先頭から）
+    tu = t.upper()
+    aligned = len(tu) == len(t)
 
-    lm = re.search(r"(<LOGSHEET\b.*?</LOGSHEET>)", t, flags=re.DOTALL | re.IGNORECASE)
-    log_block = lm.group(1) if lm else None
+    def _block(pattern: re.Pattern, open_tag: str) -> Optional[str]:
+        pos = tu.find(open_tag)
+        if pos < 0:
+            return None
+        m = pattern.search(t, pos if aligned else 0)
+        return m.group(1) if m else None
+
+    summary_block = _block(_RE_SUMMARY, "<SUMMARYSHEET")
+    log_block = _block(_RE_LOGSHEET, "<LOGSHEET")
 
     log_type = None
     if log_block:
@@ -685,11 +834,11 @@ def parse_summarysheet(summary_block: str) -> Dict[str, Any]:
     d["comments"] = _strip_tags_text(_find_tag(sb, "COMMENTS") or "")
 
     score_50 = None
-    m = re.search(r"<SCORE\b[^>]*BAND\s*=\s*(\"|')?50MHz\1?[^>]*>(.*?)</SCORE>", sb, flags=re.DOTALL | re.IGNORECASE)
+    m = _RE_SCORE_50.search(sb)
     if m:
         score_50 = _strip_tags_text(m.group(2))
     if not score_50:
-        m = re.search(r"<SCORE\b[^>]*BAND\s*=\s*(\"|')?TOTAL\1?[^>]*>(.*?)</SCORE>", sb, flags=re.DOTALL | re.IGNORECASE)
+        m = _RE_SCORE_TOTAL.search(sb)
         if m:
             score_50 = _strip_tags_text(m.group(2))
     qso, pts, mult = _parse_score_triplet(score_50 or "")
@@ -701,8 +850,8 @@ def parse_summarysheet(summary_block: str) -> Dict[str, Any]:
 
 def parse_logsheet_block(log_block: str, log_type: str) -> List[QsoRecord]:
     lb = _clean(log_block or "")
-    inner = re.sub(r"^<LOGSHEET\b[^>]*>", "", lb, flags=re.IGNORECASE).strip()
-    inner = re.sub(r"</LOGSHEET>\s*$", "", inner, flags=re.IGNORECASE).strip()
+    inner = _RE_LOGSHEET_OPEN.sub("", lb).strip()
+    inner = _RE_LOGSHEET_CLOSE.sub("", inner).strip()
     lines = [ln.rstrip("\n") for ln in inner.split("\n")]
     return parse_logsheet_generic(lines, log_type or "")
 
@@ -721,7 +870,7 @@ def build_station_entry_from_text(
     if summary_block:
         sd = parse_summarysheet(summary_block)
         entry.callsign = sd.get("callsign", "") or fallback_callsign
-        entry.category = sd.get("categorycode", "") or ""
+        entry.category = sys.intern(sd.get("categorycode", "") or "")
         entry.category_name = sd.get("categoryname", "") or ""
         entry.address = sd.get("address", "") or ""
         entry.comments = sd.get("comments", "") or ""
@@ -765,25 +914,96 @@ def build_station_entry_from_text(
 
     return entry
 
+def read_submission_file(path: str) -> str:
+    """
+    提出ファイルを読み込む（mmapでページキャッシュから直接デコード、中間のbytesコピーを作らない）
+    従来の open(..., "r", encoding="utf-8", errors="ignore") と同じく改行は \n に揃える
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8", "ignore")
+    return _clean(text)
+
+SUBMISSION_EXTS = frozenset({".log", ".txt", ".dat", ".adi", ".sum", ".xml"})
+
+def _list_submission_files(folder: str) -> List[str]:
+    """
+    フォルダ直下の提出ファイル（SUBMISSION_EXTS）をパス順で返す。走査は os.scandir の1回だけ。
+    glob("*.log") 等と同じく隠しファイルは除き、拡張子の大小文字は OS の扱いに合わせる
+    """
+    files: List[str] = []
+    with os.scandir(folder) as it:
+        for de in it:
+            name = de.name
+            if name.startswith("."):
+                continue
+            if os.path.normcase(os.path.splitext(name)[1]) not in SUBMISSION_EXTS:
+                continue
+            if de.is_file():
+                files.append(de.path)
+    files.sort()
+    return files
+
+# 並列処理のプロセスは spawn で起動する（Tk と作業スレッドが動いているプロセスを fork しない。Windows と同じ方式）
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# この数以上のファイルを読む時だけ複数プロセスで解析（少数だとプロセス起動の方が重い）
+PARALLEL_LOAD_MIN_FILES = 32
+
+def _entry_from_file_text(path: str, text: str) -> StationEntry:
+    return build_station_entry_from_text(
+        text=text,
+        fallback_callsign="",
+        fallback_opplace="",
+        source_name=os.path.basename(path)
+    )
+
+def _load_submission_file(path: str) -> StationEntry:
+    return _entry_from_file_text(path, read_submission_file(path))
+
+def load_submission_files(paths: List[str]) -> Tuple[List[StationEntry], List[str]]:
+    """
+    提出ファイル群を解析して (entries, errors) を返す。entries は paths の順。
+    ファイル数が多い時は ProcessPoolExecutor で並列に解析する。
+    """
+    if len(paths) >= PARALLEL_LOAD_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            entries: List[StationEntry] = []
+            errors: List[str] = []
+            with ProcessPoolExecutor(mp_context=_MP_CONTEXT) as ex:
+                futs = [ex.submit(_load_submission_file, fp) for fp in paths]
+                for fp, fut in zip(paths, futs):
+                    try:
+                        entries.append(fut.result())
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        errors.append(f"{os.path.basename(fp)}: {e}")
+            return entries, errors
+        except (BrokenProcessPool, OSError):
+            # プロセスが使えない環境では従来どおり1本で読む
+            pass
+
+    # 少数のファイルは1プロセスで解析し、読み込み（I/O待ち）だけをスレッドで重ねる
+    entries = []
+    errors = []
+    workers = min(32, (os.cpu_count() or 1) * 4, max(1, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futs = [ex.submit(read_submission_file, fp) for fp in paths]
+        for fp, fut in zip(paths, futs):
+            try:
+                entries.append(_entry_from_file_text(fp, fut.result()))
+            except Exception as e:
+                errors.append(f"{os.path.basename(fp)}: {e}")
+    return entries, errors
+
 
 # -----------------------------
 # Scoring / validation
 # -----------------------------
 
-def mark_duplicates(qsos: List[QsoRecord]) -> None:
-    seen: set[Tuple[str, str, str]] = set()
-    for q in qsos:
-        key = (q.band_mhz.strip(), q.mode.strip().upper(), q.worked_call.strip().upper())
-        if key in seen:
-            q.dup = True
-            q.pts = 0
-        else:
-            if q.pts == 0:
-                q.dup = True
-            else:
-                q.dup = False
-            seen.add(key)
-
 def _apply_manual_override(entry: StationEntry) -> None:
     if not entry.manual_enabled:
         return
@@ -803,18 +1023,31 @@ def _apply_manual_override(entry: StationEntry) -> None:
         entry.opplace = normalize_opplace_any(entry.manual_opplace.strip(), entry.address)
 
 def recalc_entry(entry: StationEntry) -> None:
-    qsos = list(entry.qsos or [])
-    mark_duplicates(qsos)
+    entry._rank_metrics_cache = None
 
-    valid = [q for q in qsos if (not q.dup) and q.pts > 0]
-    entry.recalced_qso = len(valid)
-    entry.recalced_pts = sum(int(q.pts) for q in valid)
-
-    mult_set = set()
-    for q in valid:
-        ex = _canon_exchange(q.rcvd_exch)
+    # DUP判定・有効QSO数・素点・マルチ集計を1パスで行う
+    # DUP：同じ (バンド, モード, コール) の2回目以降（0点にする）。0点のQSOも DUP 扱い
+    seen: set[Tuple[str, str, str]] = set()
+    mult_set: set[str] = set()
+    qso_n = 0
+    pts_sum = 0
+    for q in entry.qsos or ():
+        key = (q.band_key, q.mode_key, q.call_key)
+        if key in seen:
+            q.dup = True
+            q.pts = 0
+            continue
+        seen.add(key)
+        q.dup = (q.pts == 0)
+        if q.pts <= 0:
+            continue
+        qso_n += 1
+        pts_sum += int(q.pts)
+        ex = q.rcvd_exch_canon
         if ex:
             mult_set.add(ex)
+    entry.recalced_qso = qso_n
+    entry.recalced_pts = pts_sum
     entry.recalced_mult = len(mult_set)
     entry.recalced_total = entry.recalced_pts * entry.recalced_mult
 
@@ -848,13 +1081,18 @@ def recalc_entry(entry: StationEntry) -> None:
 # -----------------------------
 
 def _entry_rank_metrics(e: StationEntry) -> Tuple[int, int, int, int]:
-    return (int(e.recalced_total), int(e.recalced_pts), int(e.recalced_mult), int(e.recalced_qso))
+    m = e._rank_metrics_cache
+    if m is None:
+        m = (int(e.recalced_total), int(e.recalced_pts), int(e.recalced_mult), int(e.recalced_qso))
+        e._rank_metrics_cache = m
+    return m
+
+def _rank_entries_key(e: StationEntry) -> Tuple[int, int, int, int, str]:
+    total, pts, mult, qso = _entry_rank_metrics(e)
+    return (-total, -pts, -mult, -qso, e.callsign)
 
 def rank_entries(entries: List[StationEntry]) -> List[Tuple[int, StationEntry]]:
-    sorted_es = sorted(
-        entries,
-        key=lambda e: (-int(e.recalced_total), -int(e.recalced_pts), -int(e.recalced_mult), -int(e.recalced_qso), e.callsign)
-    )
+    sorted_es = sorted(entries, key=_rank_entries_key)
     ranked: List[Tuple[int, StationEntry]] = []
     prev_metrics: Optional[Tuple[int, int, int, int]] = None
     prev_rank = 0
@@ -918,8 +1156,10 @@ def refresh_table(self) -> None:
 
 
 
-def top_n_with_ties(entries: List[StationEntry], n: int) -> List[Tuple[int, StationEntry]]:
-    ranked = rank_entries(entries)
+def top_n_from_ranked(ranked: List[Tuple[int, StationEntry]], n: int) -> List[Tuple[int, StationEntry]]:
+    """
+    rank_entries() 済みのリストから上位n（n位と同点の局も含む）を取り出す
+    """
     if n <= 0 or not ranked:
         return []
     if len(ranked) <= n:
@@ -937,22 +1177,13 @@ def top_n_with_ties(entries: List[StationEntry], n: int) -> List[Tuple[int, Stat
             break
     return out
 
-import re
-from typing import Optional
-
 def extract_call_area_digit_base(callsign: str) -> Optional[int]:
-    base = (callsign or "").strip().upper().split("/")[0]
-    print(f"Extracting area from callsign: {callsign}, base: {base}")
-    
-    # 'split' の結果が空でないか確認
-    parts = callsign.split("/")
+    # "JA2XXX/1" のように / の後ろにエリアがある場合だけ数値で返す
+    parts = (callsign or "").strip().upper().split("/")
     if len(parts) > 1:
-        area = parts[1]
-        print(f"Extracted area from callsign with /: {area}")
-        return int(area)
-    
+        return int(parts[1])
+
     # エリアが指定されていない場合
-    print(f"No area found for callsign: {callsign}")
     return None
 
 
@@ -970,7 +1201,7 @@ def qso_to_ctestwin_line(q: QsoRecord) -> str:
     call = _clean_callsign(q.worked_call or "")
 
     sent = _canon_exchange(q.sent_exch) or "-"
-    rcvd = _canon_exchange(q.rcvd_exch) or "-"
+    rcvd = q.rcvd_exch_canon or "-"
 
     pts = _safe_int(q.pts, 2)
     return f"{date} {time} {band} {mode} {call} 59 {sent} 59 {rcvd} {pts}"
@@ -978,18 +1209,23 @@ def qso_to_ctestwin_line(q: QsoRecord) -> str:
 def replace_logsheet_with_ctestwin(raw_text: str, entry: StationEntry) -> str:
     t = _clean(raw_text or "")
 
-    lines = [qso_to_ctestwin_line(q) for q in (entry.qsos or [])]
-    new_log = "<LOGSHEET TYPE=CTESTWIN>\n" + "\n".join(lines) + "\n</LOGSHEET>"
+    # 行リストを作らず1回の join で LOGSHEET 全体を組み立てる
+    new_log = "".join((
+        "<LOGSHEET TYPE=CTESTWIN>\n",
+        "\n".join(map(qso_to_ctestwin_line, entry.qsos or ())),
+        "\n</LOGSHEET>",
+    ))
 
-    if re.search(r"<LOGSHEET\b.*?</LOGSHEET>", t, flags=re.DOTALL | re.IGNORECASE):
-        return re.sub(r"<LOGSHEET\b.*?</LOGSHEET>", new_log, t, flags=re.DOTALL | re.IGNORECASE)
+    replaced, n = _RE_LOGSHEET.subn(new_log, t)
+    if n:
+        return replaced
 
-    sm = re.search(r"(<SUMMARYSHEET\b.*?</SUMMARYSHEET>)", t, flags=re.DOTALL | re.IGNORECASE)
+    sm = _RE_SUMMARY.search(t)
     if sm:
         idx = sm.end()
-        return t[:idx] + "\n" + new_log + "\n" + t[idx:]
+        return "".join((t[:idx], "\n", new_log, "\n", t[idx:]))
 
-    return (t.rstrip() + "\n" + new_log + "\n")
+    return "".join((t.rstrip(), "\n", new_log, "\n"))
 
 
 # -----------------------------
@@ -997,47 +1233,58 @@ def replace_logsheet_with_ctestwin(raw_text: str, entry: StationEntry) -> str:
 # -----------------------------
 
 def _rank_sort_key(e: StationEntry) -> Tuple[int, int, int, int, str]:
-    return (
-        -int(e.recalced_total),
-        -int(e.recalced_pts),
-        -int(e.recalced_mult),
-        -int(e.recalced_qso),
-        (e.callsign or ""),
-    )
+    # int() 変換は recalc 後に1回だけ（_entry_rank_metrics のキャッシュを共有）
+    total, pts, mult, qso = _entry_rank_metrics(e)
+    return (-total, -pts, -mult, -qso, e.callsign or "")
 
 
 def _competition_ranks(entries_sorted: List[StationEntry]) -> List[Tuple[int, StationEntry]]:
+    # 同点は同順位、次の順位は飛ばす（1,1,3...）。1回の走査で位置と直前の得点だけを見る
     out: List[Tuple[int, StationEntry]] = []
+    append = out.append
     prev_total: Optional[int] = None
     rank = 0
-    pos = 0
-    for e in entries_sorted:
-        pos += 1
+    for pos, e in enumerate(entries_sorted, 1):
         t = int(e.recalced_total)
-        if prev_total is None or t != prev_total:
+        if t != prev_total:
             rank = pos
             prev_total = t
-        out.append((rank, e))
+        append((rank, e))
     return out
 
 def _h(x: Any) -> str:
     return html.escape(str(x) if x is not None else "")
 
-def _html_table(headers: List[str], rows: List[List[Any]]) -> str:
-    th = "".join([f"<th>{_h(hd)}</th>" for hd in headers])
-    trs = []
+def _html_table(headers: List[str], rows: List[List[Any]], esc_cache: Optional[Dict[str, str]] = None) -> str:
+    # 大きな結果表でも一時リストを作らず、1つのバッファに順に書き出す（_h はインライン化）
+    # 部門名・運用地・点数などは同じ文字列が何度も出るので、エスケープ結果は esc_cache で使い回す
+    esc = html.escape
+    cache = {} if esc_cache is None else esc_cache
+    buf = io.StringIO()
+    w = buf.write
+    w("<table class='tbl'><thead><tr>")
+    for hd in headers:
+        w("<th>")
+        w(esc(str(hd)) if hd is not None else "")
+        w("</th>")
+    w("</tr></thead><tbody>")
     for r in rows:
-        tds = "".join([f"<td>{_h(v)}</td>" for v in r])
-        trs.append(f"<tr>{tds}</tr>")
-    return (
-        "<table class='tbl'>"
-        f"<thead><tr>{th}</tr></thead>"
-        f"<tbody>{''.join(trs)}</tbody>"
-        "</table>"
-    )
-
-def _html_page(title: str, body_html: str) -> str:
-    css = """
+        w("<tr>")
+        for v in r:
+            w("<td>")
+            if v is not None:
+                t = str(v)
+                t_esc = cache.get(t)
+                if t_esc is None:
+                    t_esc = cache[t] = esc(t)
+                w(t_esc)
+            w("</td>")
+        w("</tr>")
+    w("</tbody></table>")
+    return buf.getvalue()
+
+# 公開用HTMLの共通CSSとページの前半（タイトル前後）。ページごとに組み立て直さない
+_HTML_CSS = """
     body{font-family:system-ui,-apple-system,Segoe UI,Roboto,Helvetica,Arial,'Noto Sans JP','Hiragino Kaku Gothic ProN',Meiryo,sans-serif; margin:24px; line-height:1.5;}
     h1{font-size:22px; margin:0 0 12px 0;}
     h2{font-size:18px; margin:26px 0 10px 0;}
@@ -1054,18 +1301,23 @@ def _html_page(title: str, body_html: str) -> str:
     .badge{display:inline-block; padding:2px 8px; border:1px solid #bbb; border-radius:999px; font-size:12px; margin-left:8px; color:#444;}
     .checklog{background:#fff3cd; border-color:#ffe69c;}
     """
-    return (
-        "<!doctype html>"
-        "<html lang='ja'><head>"
-        "<meta charset='utf-8'>"
-        f"<title>{_h(title)}</title>"
-        f"<style>{css}</style>"
-        "</head><body>"
-        f"<h1>{_h(title)}</h1>"
-        f"{body_html}"
-        "</body></html>"
-    )
+_HTML_HEAD = (
+    "<!doctype html>"
+    "<html lang='ja'><head>"
+    "<meta charset='utf-8'>"
+    "<title>"
+)
+_HTML_MID = "</title><style>" + _HTML_CSS + "</style></head><body><h1>"
+_HTML_TAIL = "</body></html>"
+
+def _html_page_head(title: str) -> str:
+    """
+    ページの先頭〜<h1>見出し</h1> まで（本文を順に書き出す時は、この後に本文と _HTML_TAIL を書く）
+    """
+    t = _h(title)
+    return "".join((_HTML_HEAD, t, _HTML_MID, t, "</h1>"))
 
+@lru_cache(maxsize=64)
 def category_display(code: str) -> str:
     c = (code or "").strip()
     if not c:
@@ -1081,19 +1333,62 @@ def category_display(code: str) -> str:
 # ★PDF Certificate / Entry Certificate
 # -----------------------------
 
+_FONT_REGISTERED = False
+
 def _ensure_fonts() -> None:
     """
     ReportLab日本語フォントをCIDで登録（環境依存が少ない）
+    登録できたら以降の呼び出しは何もしない（一括出力で毎回確認しない）
     """
+    global _FONT_REGISTERED
+    if _FONT_REGISTERED:
+        return
     try:
         pdfmetrics.getFont("HeiseiKakuGo-W5")
+        _FONT_REGISTERED = True
     except:
         try:
             pdfmetrics.registerFont(UnicodeCIDFont("HeiseiKakuGo-W5"))
+            _FONT_REGISTERED = True
         except:
             # 最悪の場合：和文はHelveticaで出るが文字化けする可能性あり
             pass
 
+@lru_cache(maxsize=8)
+def _bg_reader(path: str, mtime: float) -> ImageReader:
+    """
+    背景画像の ImageReader（同じ画像を証書ごとに読み直さない。mtime が変われば読み直す）
+    """
+    return ImageReader(path)
+
+_CID_WIDTHS: Dict[str, Dict[str, int]] = {}
+
+def _cid_unicode_widths(font_name: str) -> Optional[Dict[str, int]]:
+    """
+    UnicodeCIDFont の文字幅表（1/1000 em 単位の整数）を返す。CIDフォント以外・未登録は None
+    """
+    widths = _CID_WIDTHS.get(font_name)
+    if widths is None:
+        try:
+            font = pdfmetrics.getFont(font_name)
+        except Exception:
+            return None
+        if not isinstance(font, UnicodeCIDFont):
+            return None
+        widths = _CID_WIDTHS[font_name] = font.unicodeWidths
+    return widths
+
+def _prefix_units(text: str, widths: Dict[str, int]) -> List[int]:
+    """
+    文字幅（1/1000 em 単位）の累積和。prefix[j] - prefix[i] が text[i:j] の幅になる
+    """
+    prefix = [0] * (len(text) + 1)
+    acc = 0
+    for k, ch in enumerate(text):
+        acc += widths.get(ch, 1000)
+        prefix[k + 1] = acc
+    return prefix
+
 def _wrap_by_width(text: str, font_name: str, font_size: int, max_width: float) -> List[str]:
     """
     文字幅（stringWidth）で簡易折り返し。日本語も1文字ずつ積み上げでOK。
@@ -1101,30 +1396,52 @@ def _wrap_by_width(text: str, font_name: str, font_size: int, max_width: float)
     if not text:
         return []
     out: List[str] = []
-    cur = ""
-    for ch in text:
-        if ch == "\n":
-            if cur:
-                out.append(cur)
-                cur = ""
-            continue
-        nxt = cur + ch
-        try:
-            w = pdfmetrics.stringWidth(nxt, font_name, font_size)
-        except:
-            w = len(nxt) * (font_size * 0.55)
-        if w <= max_width:
-            cur = nxt
-        else:
-            if cur:
-                out.append(cur)
-                cur = ch
+    widths = _cid_unicode_widths(font_name)
+    if widths is None:
+        cur = ""
+        for ch in text:
+            if ch == "\n":
+                if cur:
+                    out.append(cur)
+                    cur = ""
+                continue
+            nxt = cur + ch
+            w = _text_width(nxt, font_name, font_size)
+            if w <= max_width:
+                cur = nxt
             else:
-                out.append(nxt)
-                cur = ""
-    if cur:
-        out.append(cur)
+                if cur:
+                    out.append(cur)
+                    cur = ch
+                else:
+                    out.append(nxt)
+                    cur = ""
+        if cur:
+            out.append(cur)
+        return out
+
+    # CIDフォント：累積和で1行分の文字数を見積もってジャンプし、前後1文字ずつ補正する
+    # （幅は stringWidth と同じ式 size * 0.001 * 整数和 で比較）
+    scale = font_size * 0.001
+    estimate = max(1, int(max_width // (scale * widths.get("あ", 1000) or 1)))
+    for seg in text.split("\n"):
+        n = len(seg)
+        if not n:
+            continue
+        prefix = _prefix_units(seg, widths)
+        i = 0
+        while i < n:
+            j = min(n, i + estimate)
+            while j > i + 1 and scale * (prefix[j] - prefix[i]) > max_width:
+                j -= 1
+            while j < n and scale * (prefix[j + 1] - prefix[i]) <= max_width:
+                j += 1
+            # 1文字でも収まらない場合はその1文字だけで1行
+            out.append(seg[i:j])
+            i = j
     return out
+
+@lru_cache(maxsize=4096)
 def _text_width(text: str, font_name: str, font_size: int) -> float:
     try:
         return pdfmetrics.stringWidth(text, font_name, font_size)
@@ -1133,6 +1450,9 @@ def _text_width(text: str, font_name: str, font_size: int) -> float:
         return len(text) * (font_size * 0.55)
 
 
+# 2行分割で「途中で切りたくない」ASCII文字（例: "AM/50MHz"）
+_ASCII_BREAK_SET = frozenset(string.ascii_letters + string.digits + "/")
+
 def _split_two_lines_balanced(
     text: str,
     font_name: str,
@@ -1167,36 +1487,55 @@ def _split_two_lines_balanced(
         return 1.0
 
     def ascii_break_penalty(left_last: str, right_first: str) -> float:
-        import string
-        ascii_set = set(string.ascii_letters + string.digits + "/")
-        if left_last in ascii_set and right_first in ascii_set:
+        if left_last in _ASCII_BREAK_SET and right_first in _ASCII_BREAK_SET:
             return 2.0
         return 0.0
 
     best = None  # (score, i, w1, w2)
     n = len(s)
+    # CIDフォントなら文字幅の累積和を1回作り、各分割点の幅を O(1) で求める
+    widths = _cid_unicode_widths(font_name)
+    prefix = _prefix_units(s, widths) if widths is not None else None
+    # 各分割点 i について s[:i].rstrip() の長さ／s[i:].lstrip() の開始位置を一度に求めておく
+    left_len = [0] * (n + 1)
+    for k in range(1, n + 1):
+        left_len[k] = left_len[k - 1] if s[k - 1].isspace() else k
+    right_start = [n] * (n + 1)
+    for k in range(n - 1, -1, -1):
+        right_start[k] = right_start[k + 1] if s[k].isspace() else k
+    # 区切り文字の組ごとのペナルティ（同じ組は使い回す）
+    k_boundary = font_size * 1.5
+    k_ascii = font_size * 3.0
+    penalties: Dict[Tuple[str, str], Tuple[float, float]] = {}
     # 全分割点をスキャン（先頭や末尾は除外）
     for i in range(1, n):
-        left = s[:i].rstrip()
-        right = s[i:].lstrip()
-        if not left or not right:
+        le = left_len[i]
+        rs = right_start[i]
+        if not le or rs == n:
             continue
 
-        left_last = left[-1]
-        right_first = right[0]
-
         # 幅を計測
-        w1 = _text_width(left, font_name, font_size)
-        w2 = _text_width(right, font_name, font_size)
+        if prefix is not None:
+            w1 = font_size * 0.001 * prefix[le]
+            w2 = font_size * 0.001 * (prefix[n] - prefix[rs])
+        else:
+            w1 = _text_width(s[:le], font_name, font_size)
+            w2 = _text_width(s[rs:], font_name, font_size)
 
         # 両方が max_width を超える分割は無視
         if w1 > max_width or w2 > max_width:
             continue
 
-        diff = abs(w1 - w2)
-        score = diff
-        score += boundary_penalty(left_last, right_first) * (font_size * 1.5)
-        score += ascii_break_penalty(left_last, right_first) * (font_size * 3.0)
+        pair = (s[le - 1], s[rs])
+        pen = penalties.get(pair)
+        if pen is None:
+            pen = penalties[pair] = (
+                boundary_penalty(*pair) * k_boundary,
+                ascii_break_penalty(*pair) * k_ascii,
+            )
+        score = abs(w1 - w2)
+        score += pen[0]
+        score += pen[1]
 
         if best is None or score < best[0]:
             best = (score, i, w1, w2)
@@ -1206,7 +1545,27 @@ def _split_two_lines_balanced(
         return _wrap_by_width(s, font_name, font_size, max_width)[:2]
 
     i = best[1]
-    return [s[:i].rstrip(), s[i:].lstrip()]
+    return [s[:left_len[i]], s[right_start[i]:]]
+
+@lru_cache(maxsize=16)
+def _award_body_lines(body: str, max_text_w: float, body_size: int) -> Tuple[Tuple[str, ...], int]:
+    """
+    賞状本文の2行分割とフォントサイズを決める（全局で同じ結果なので一括出力ではキャッシュを使う）
+    """
+    # まず指定サイズで2行化、収まらない場合はサイズを落として再試行
+    fs = body_size
+    while fs >= 12:
+        lines2 = _split_two_lines_balanced(body, "HeiseiKakuGo-W5", fs, max_text_w)
+        if len(lines2) >= 2:
+            w1 = _text_width(lines2[0], "HeiseiKakuGo-W5", fs)
+            w2 = _text_width(lines2[1], "HeiseiKakuGo-W5", fs)
+            if w1 <= max_text_w and w2 <= max_text_w:
+                break
+        fs -= 1
+    else:
+        lines2 = _wrap_by_width(body, "HeiseiKakuGo-W5", 12, max_text_w)[:2]
+        fs = 12
+    return tuple(lines2[:2]), fs
 
 def _draw_center(c: rl_canvas.Canvas, text: str, y: float, font: str, size: int) -> None:
     c.setFont(font, size)
@@ -1228,6 +1587,22 @@ def _draw_multiline_center(c: rl_canvas.Canvas, lines: List[str], y_top: float,
 def _bg_path_from_folder(folder: str, filename: str) -> str:
     return os.path.join(folder, filename)
 
+def _award_body_layout() -> Tuple[Tuple[str, ...], int]:
+    """
+    賞状本文（AWARD_SENTENCE）の2行とフォントサイズ
+    """
+    return _award_body_lines(AWARD_SENTENCE.strip(), A4[0] - 60*mm, 16)
+
+def _entry_body_lines() -> List[str]:
+    """
+    参加証本文の行
+    """
+    body = f"{CONTEST_TITLE}にご参加いただき\nありがとうございました"
+    return _wrap_by_width(body, "HeiseiKakuGo-W5", 14, A4[0] - 60*mm)
+
+def _issue_date_text() -> str:
+    return datetime.now().strftime("%Y年%m月%d日")
+
 def generate_award_pdf_one(
     out_path: str,
     bg_path: str,
@@ -1249,7 +1624,7 @@ def generate_award_pdf_one(
 
     # 背景
     if bg_path and os.path.isfile(bg_path):
-        img = ImageReader(bg_path)
+        img = _bg_reader(bg_path, os.path.getmtime(bg_path))
         c.drawImage(img, 0, 0, width=page_w, height=page_h, preserveAspectRatio=False, mask='auto')
 
     # ----------------
@@ -1273,9 +1648,8 @@ def generate_award_pdf_one(
     y_score = page_h - 156*mm
     score_size = 16
 
-    # ★本文：大きく、2行バランス
+    # ★本文：大きく、2行バランス（サイズは _award_body_layout）
     y_body  = page_h - 176*mm
-    body_size = 16
     body_leading = 9*mm
 
     # ★発行日：大きく
@@ -1303,27 +1677,12 @@ def generate_award_pdf_one(
     _draw_center(c, f"Total Score  {total_score:,}", y_score, "Helvetica-Bold", score_size)
 
     # 本文（必ず2行・幅を揃える）
-    max_text_w = page_w - 60*mm
-    body = AWARD_SENTENCE.strip()
+    lines2, fs = _award_body_layout()
 
-    # まず指定サイズで2行化、収まらない場合はサイズを落として再試行
-    fs = body_size
-    while fs >= 12:
-        lines2 = _split_two_lines_balanced(body, "HeiseiKakuGo-W5", fs, max_text_w)
-        if len(lines2) >= 2:
-            w1 = _text_width(lines2[0], "HeiseiKakuGo-W5", fs)
-            w2 = _text_width(lines2[1], "HeiseiKakuGo-W5", fs)
-            if w1 <= max_text_w and w2 <= max_text_w:
-                break
-        fs -= 1
-    else:
-        lines2 = _wrap_by_width(body, "HeiseiKakuGo-W5", 12, max_text_w)[:2]
-        fs = 12
-
-    _draw_multiline_center(c, lines2[:2], y_body, leading=body_leading, font="HeiseiKakuGo-W5", size=fs)
+    _draw_multiline_center(c, list(lines2), y_body, leading=body_leading, font="HeiseiKakuGo-W5", size=fs)
 
     # 発行日
-    today = datetime.now().strftime("%Y年%m月%d日")
+    today = _issue_date_text()
     _draw_center(c, today, y_date, "HeiseiKakuGo-W5", date_size)
 
     # 主催者名
@@ -1333,53 +1692,6 @@ def generate_award_pdf_one(
     c.save()
 
 
-
-    """
-    text を「2行」に分割し、2行の幅がなるべく同じになる分割点を探す。
-    両行とも max_width を超えない範囲でベストを選ぶ。
-    無理なら通常の _wrap_by_width にフォールバック。
-    """
-    s = (text or "").replace("\n", "").strip()
-    if not s:
-        return []
-
-    # 1行に収まるならそのまま
-    if _text_width(s, font_name, font_size) <= max_width:
-        return [s]
-
-    # 2行目先頭に来ると不自然な記号は避ける（必要なら増やしてOK）
-    bad_line2_head = set("、。,.)]】』」〉》）:;!?％%ー—‐-")
-
-    best = None
-    n = len(s)
-    mid = n / 2.0
-
-    for i in range(1, n):
-        l1 = s[:i].rstrip()
-        l2 = s[i:].lstrip()
-        if not l1 or not l2:
-            continue
-        if l2[0] in bad_line2_head:
-            continue
-
-        w1 = _text_width(l1, font_name, font_size)
-        w2 = _text_width(l2, font_name, font_size)
-
-        if w1 > max_width or w2 > max_width:
-            continue
-
-        # 幅の差を最小化。ついでに真ん中寄りを少し優先
-        score = abs(w1 - w2) + abs(i - mid) * 0.05
-        if (best is None) or (score < best[0]):
-            best = (score, l1, l2)
-
-    if best:
-        return [best[1], best[2]]
-
-    # どうしても2行に収まらない（or良い分割が無い）場合は通常折り返し
-    return _wrap_by_width(s, font_name, font_size, max_width)
-
-
 def generate_entry_pdf_one(
     out_path: str,
     bg_path: str,
@@ -1398,7 +1710,7 @@ def generate_entry_pdf_one(
     c = rl_canvas.Canvas(out_path, pagesize=A4)
 
     if bg_path and os.path.isfile(bg_path):
-        img = ImageReader(bg_path)
+        img = _bg_reader(bg_path, os.path.getmtime(bg_path))
         c.drawImage(img, 0, 0, width=page_w, height=page_h, preserveAspectRatio=False, mask="auto")
 
     # --- レイアウト（mm）---
@@ -1416,7 +1728,7 @@ def generate_entry_pdf_one(
     fs_line1 = 18
     fs_call  = 42
     fs_score = 16
-    fs_body  = 14
+    fs_body  = 14  # _entry_body_lines で折り返す時のサイズと合わせる
     fs_org   = 16
 
     _draw_center(c, f"{CONTEST_TITLE} 参加証", y_title, "HeiseiKakuGo-W5", fs_title)
@@ -1428,8 +1740,7 @@ def generate_entry_pdf_one(
     _draw_center(c, callsign, y_call, "Helvetica-Bold", fs_call)
     _draw_center(c, f"Total Score  {total_score:,}", y_score, "Helvetica-Bold", fs_score)
 
-    body = f"{CONTEST_TITLE}にご参加いただき\nありがとうございました"
-    lines = _wrap_by_width(body, "HeiseiKakuGo-W5", fs_body, page_w - 60*mm)
+    lines = _entry_body_lines()
     _draw_multiline_center(c, lines, y_top=y_body, leading=7*mm, font="HeiseiKakuGo-W5", size=fs_body)
 
 
@@ -1439,46 +1750,179 @@ def generate_entry_pdf_one(
     c.save()
 
 
+PARALLEL_PDF_MIN_FILES = 8
+
+# 1枚分の引数： (out_path, bg_path, callsign, year, category_code, rank, total_score)
+AwardJob = Tuple[str, str, str, int, str, int, int]
+# 1枚分の引数： (out_path, bg_path, callsign, year, category_code, total_score)
+EntryJob = Tuple[str, str, str, int, str, int]
+
+def _render_award(job: AwardJob) -> None:
+    out_path, bg_path, callsign, year, category_code, rank, total_score = job
+    generate_award_pdf_one(
+        out_path=out_path,
+        bg_path=bg_path,
+        callsign=callsign,
+        year=year,
+        category_code=category_code,
+        rank=rank,
+        total_score=total_score,
+    )
+
+def _render_entry(job: EntryJob) -> None:
+    out_path, bg_path, callsign, year, category_code, total_score = job
+    generate_entry_pdf_one(
+        out_path=out_path,
+        bg_path=bg_path,
+        callsign=callsign,
+        year=year,
+        category_code=category_code,
+        total_score=total_score,
+    )
+
+def _pdf_job_key(render, job: tuple) -> str:
+    """
+    PDF 1枚の内容を決める値（種類・引数・背景画像の更新時刻・紙面に描く文字列）のハッシュ
+    部門名・本文・発行日は設定や日付で変わるので、描画に使うのと同じ関数で求めた文字列を入れる
+    """
+    _ensure_fonts()
+    bg_path = job[1]
+    bg_mtime = os.path.getmtime(bg_path) if bg_path and os.path.isfile(bg_path) else None
+    if render is _render_award:
+        texts = (_award_body_layout(), _issue_date_text())
+    else:
+        texts = (tuple(_entry_body_lines()),)
+    key = (render.__name__, job[1:], bg_mtime, CONTEST_TITLE, ORGANIZER_NAME, category_display(job[4]), texts)
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+def _render_if_changed(render, job: tuple, force: bool = False) -> bool:
+    """
+    前回と同じ内容の PDF（out_path と {out_path}.hash が残っている）は作り直さない。生成したら True
+    force=True なら常に作り直す
+    """
+    out_path = job[0]
+    hash_path = out_path + ".hash"
+    key = _pdf_job_key(render, job)
+    if not force and os.path.isfile(out_path) and os.path.isfile(hash_path):
+        try:
+            with open(hash_path, "r", encoding="ascii") as f:
+                if f.read() == key:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+    # 作り直す前に古い .hash を消し、生成が終わってから新しい .hash を置く
+    # （生成に失敗した・途中で止まった PDF を次回「変更なし」と見なさない）
+    try:
+        os.remove(hash_path)
+    except FileNotFoundError:
+        pass
+    render(job)
+    tmp_path = hash_path + ".tmp"
+    with open(tmp_path, "w", encoding="ascii") as f:
+        f.write(key)
+    os.replace(tmp_path, hash_path)
+    return True
+
+def render_pdfs(render, jobs: List[tuple], progress=None, force: bool = False) -> Tuple[int, int, List[str]]:
+    """
+    PDF を jobs の数だけ生成して (saved, skipped, errors) を返す。各 job の1番目は出力先、3番目はコールサイン。
+    前回から内容が変わっていない PDF は作り直さず skipped に数える（force=True なら全部作り直す）。
+    枚数が多い時は ProcessPoolExecutor で並列に生成する（1枚ごとに独立したファイル）。
+    progress があれば1枚終わるごとに progress(終わった枚数, 全枚数) を呼ぶ（呼ばれるのは作業スレッド）。
+    """
+    total = len(jobs)
+    if total >= PARALLEL_PDF_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            saved = skipped = 0
+            failed: Dict[int, str] = {}
+            with ProcessPoolExecutor(mp_context=_MP_CONTEXT) as ex:
+                futs = {ex.submit(_render_if_changed, render, job, force): i for i, job in enumerate(jobs)}
+                # 終わった順に数えて進捗を出す（エラーは最後に jobs の順へ並べ直す）
+                for n_done, fut in enumerate(as_completed(futs), 1):
+                    i = futs[fut]
+                    try:
+                        if fut.result():
+                            saved += 1
+                        else:
+                            skipped += 1
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        failed[i] = f"{jobs[i][2]}: {e}"
+                    if progress is not None:
+                        progress(n_done, total)
+            return saved, skipped, [failed[i] for i in sorted(failed)]
+        except (BrokenProcessPool, OSError):
+            # プロセスが使えない環境では従来どおり1本で生成する
+            pass
+
+    saved = skipped = 0
+    errors: List[str] = []
+    for n_done, job in enumerate(jobs, 1):
+        try:
+            if _render_if_changed(render, job, force):
+                saved += 1
+            else:
+                skipped += 1
+        except Exception as e:
+            errors.append(f"{job[2]}: {e}")
+        if progress is not None:
+            progress(n_done, total)
+    return saved, skipped, errors
+
+
+_RE_UNSAFE_FN = re.compile(r'[\\/:*?"<>|]+')
+_FN_TT = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+
 def _safe_filename(s: str) -> str:
-    return re.sub(r'[\\/:*?"<>|]+', "_", (s or "").strip())
+    s = (s or "").strip()
+    out = s.translate(_FN_TT)
+    # 禁止文字の連続は "_" 1つにまとめる（"__" が無ければ置換結果はそのまま同じ）
+    if "__" in out:
+        return _RE_UNSAFE_FN.sub("_", s)
+    return out
 
 def build_award_lists(entries: List[StationEntry]) -> Tuple[List[Tuple[str, int, StationEntry]], List[Tuple[int, int, StationEntry]]]:
-    valid_entries = [e for e in entries if not e.is_checklog]
-
-    # 1F, 1P, 1Q, SWL 部門の局を抽出
+    # 部門コードの正規化は1局1回：1F, 1P, 1Q, SWL は部門別に、1X（1エリア外局）は別リストに振り分ける
     in_area_cats = {"1F", "1P", "1Q", "SWL"}
-    in_entries = [e for e in valid_entries if (e.category or "").strip() in in_area_cats]
-
-    # 1X 部門（1エリア外局）の局を抽出
-    out_entries = [e for e in valid_entries if (e.category or "").strip() == "1X"]
+    by_cat: Dict[str, List[StationEntry]] = {}
+    out_entries: List[StationEntry] = []
+    for e in entries:
+        if e.is_checklog:
+            continue
+        cat = (e.category or "").strip()
+        if cat in in_area_cats:
+            by_cat.setdefault(cat, []).append(e)
+        elif cat == "1X":
+            out_entries.append(e)
 
     rows_in: List[Tuple[str, int, StationEntry]] = []
-    cats = sorted({(e.category or "").strip() for e in in_entries})
-    
-    # 各部門で上位3位を抽出
-    for cat in cats:
-        es = [e for e in in_entries if (e.category or "").strip() == cat]
-        winners = top_n_with_ties(es, 3)
+
+    # 各部門で上位3位を抽出（部門ごとに1回だけ順位付け）
+    for cat in sorted(by_cat):
+        winners = top_n_from_ranked(rank_entries(by_cat[cat]), 3)
         for rank, e in winners:
             rows_in.append((cat, rank, e))
 
     # 1X 部門でエリアごとに1位を抽出
-    rows_out: List[Tuple[int, int, StationEntry]] = []
-    area_winners = {}
-
-    for e in out_entries:
+    # (エリア, -得点, 出現順) で並べ、各エリアの先頭を取る（同点は先に現れた局）
+    triples = []
+    for i, e in enumerate(out_entries):
         area = extract_call_area_digit_base(e.callsign)
-        print(f"Checking {e.callsign} with area {area} and recalced_total {e.recalced_total}")  # デバッグ用出力
-
         if area is not None:
-            # エリアごとの最高得点の局を選択
-            if area not in area_winners or e.recalced_total > area_winners[area].recalced_total:
-                area_winners[area] = e
+            triples.append((area, -int(e.recalced_total), i))
+    triples.sort()
 
-    # 各エリア1位の局を表示
-    for area, e in area_winners.items():
-        print(f"Area {area} winner: {e.callsign}, score: {e.recalced_total}")  # デバッグ用出力
-        rows_out.append((area, 1, e))
+    rows_out: List[Tuple[int, int, StationEntry]] = []
+    debug = log.isEnabledFor(logging.DEBUG)
+    prev_area = None
+    for area, _neg_total, i in triples:
+        if area != prev_area:
+            e = out_entries[i]
+            rows_out.append((area, 1, e))
+            prev_area = area
+            if debug:
+                log.debug("Area %s winner: %s, score: %s", area, e.callsign, e.recalced_total)
 
     return rows_in, rows_out
 
@@ -1487,33 +1931,155 @@ def build_award_lists(entries: List[StationEntry]) -> Tuple[List[Tuple[str, int,
 # GUI
 # -----------------------------
 
+# CSVセル内の改行・タブ（1つの空白にまとめる）
+_RE_CSV_UNSAFE = re.compile(r"[\r\n\t]+")
+
+def _csv_field(v: Any) -> str:
+    """
+    csv.writer（既定の excel 形式）と同じ規則で1項目を文字列にする
+    """
+    if type(v) is int:
+        return str(v)
+    t = "" if v is None else str(v)
+    if "," in t or '"' in t or "\r" in t or "\n" in t:
+        return '"' + t.replace('"', '""') + '"'
+    return t
+
+def _csv_line(values: Any) -> str:
+    # 列が決まっている発表用・入賞CSVは csv.writer を通さず、この1行文字列を直接書く
+    return ",".join(map(_csv_field, values)) + "\r\n"
+
+# 出力ファイルの書き込みバッファ（行ごとに小さな write を出さず、まとめて書く）
+EXPORT_WRITE_BUFFER = 1 << 20
+
+# 一覧の行タグと「一致」欄：(is_checklog, manual_enabled, match) -> (tag, match_txt)
+_ROW_TAG_MATCH: Dict[Tuple[bool, bool, bool], Tuple[str, str]] = {
+    (checklog, manual, match): (
+        "checklog" if checklog else "manual" if manual else "good" if match else "bad",
+        "CHECKLOG" if checklog else "OK" if match else "差あり",
+    )
+    for checklog in (False, True)
+    for manual in (False, True)
+    for match in (False, True)
+}
+_callsign_of = operator.attrgetter("callsign")
+
+def _table_row(e: StationEntry) -> Tuple[Tuple[Any, ...], str]:
+    """
+    一覧の1行分 (values, tag)
+    """
+    tag, match_txt = _ROW_TAG_MATCH[(bool(e.is_checklog), bool(e.manual_enabled), bool(e.match))]
+    claimed = e.claimed_total
+    values = (
+        e.callsign,
+        category_display(e.category or ""),
+        e.opplace or "",
+        e.recalced_qso,
+        e.recalced_pts,
+        e.recalced_mult,
+        e.recalced_total,
+        _safe_int(claimed, 0) if claimed is not None else "",
+        match_txt,
+        e.reason or "",
+    )
+    return values, tag
+
+AwardTuple = Tuple[str, str, str, str, int, int, int, int]
+
+def _award_tuple(e: StationEntry) -> AwardTuple:
+    """
+    出力用の局データ (callsign, categorycode, categoryname, opplace, valid_qso, pts, mult, total)
+    """
+    cat = e.category or ""
+    return (
+        e.callsign,
+        cat,
+        category_display(cat),
+        e.opplace or "",
+        int(e.recalced_qso),
+        int(e.recalced_pts),
+        int(e.recalced_mult),
+        int(e.recalced_total),
+    )
+
+def _award_tuples(entries: List[StationEntry]) -> Dict[str, AwardTuple]:
+    # 同じ局が総合・部門別・入賞の各出力に何度も出るので、コールサインごとに1回だけ作る
+    return {e.callsign: _award_tuple(e) for e in entries}
+
+
+def _json_dumps(data: Any) -> bytes:
+    # 標準 json の ensure_ascii=False, indent=2 と同じ体裁（UTF-8）
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _log_errors(title: str, errors: List[str]) -> None:
+    """
+    エラー一覧をコンソール（ログ）へ出す（先頭200件まで）
+    """
+    log.warning("---- %s ----", title)
+    for x in errors[:200]:
+        log.warning("%s", x)
+
+
 class App(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
+        # ログ出力先が未設定ならコンソールへ（従来の print と同じ見え方）
+        if not logging.getLogger().handlers:
+            logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
         self.title("コンテスト集計チェッカー（単体 main.py）")
         self.geometry("1400x820")
 
         self.folder_var = tk.StringVar(value=os.path.abspath(os.getcwd()))
         self.callsign_var = tk.StringVar(value="")
         self.opplace_var = tk.StringVar(value="")
+        # ON なら前回と同じ内容の PDF も作り直す（.hash による「変更なし」判定を使わない）
+        self.pdf_force_var = tk.BooleanVar(value=False)
 
         self.entries: Dict[str, StationEntry] = {}
+        # self.entries をコールサイン順に並べたもの／チェックログを除いたもの（entries の追加・差し替え時に捨てる）
+        self._sorted_entries_cache: Optional[List[StationEntry]] = None
+        self._active_entries_cache: Optional[List[StationEntry]] = None
         self.override_path: Optional[str] = None
+        # 読込・出力の作業スレッドが動いている間は True（その間 entries を変える操作や次の読込・出力は受け付けない）
+        self._busy = False
 
         self._build_ui()
 
-    def _get_override_path(self) -> str:
-        folder = self.folder_var.get().strip()
+    def _sorted_entries(self) -> List[StationEntry]:
+        if self._sorted_entries_cache is None:
+            self._sorted_entries_cache = sorted(self.entries.values(), key=_callsign_of)
+        return self._sorted_entries_cache
+
+    def _active_entries(self) -> List[StationEntry]:
+        if self._active_entries_cache is None:
+            self._active_entries_cache = [e for e in self.entries.values() if not e.is_checklog]
+        return self._active_entries_cache
+
+    def _entries_changed(self) -> None:
+        self._sorted_entries_cache = None
+        self._active_entries_cache = None
+
+    def _get_override_path(self, folder: Optional[str] = None) -> str:
+        if folder is None:
+            folder = self.folder_var.get().strip()
         return os.path.join(folder, "manual_overrides.json")
 
-    def load_overrides(self) -> Dict[str, Any]:
-        path = self._get_override_path()
+    def load_overrides(self, folder: Optional[str] = None) -> Dict[str, Any]:
+        path = self._get_override_path(folder)
         self.override_path = path
         if not os.path.isfile(path):
             return {}
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
             if isinstance(data, dict):
                 return data
             return {}
@@ -1536,13 +2102,13 @@ class App(tk.Tk):
                     "opplace": e.manual_opplace,
                 }
         try:
-            with open(self.override_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(self.override_path, "wb") as f:
+                f.write(_json_dumps(data))
         except Exception as ex:
             messagebox.showwarning("保存失敗", f"manual_overrides.json の保存に失敗しました。\n{ex}")
 
-    def apply_overrides_to_entries(self) -> None:
-        data = self.load_overrides()
+    def apply_overrides_to_entries(self, folder: Optional[str] = None) -> None:
+        data = self.load_overrides(folder)
         for cs, e in self.entries.items():
             od = data.get(cs)
             if not isinstance(od, dict):
@@ -1564,20 +2130,35 @@ class App(tk.Tk):
         self.folder_entry = ttk.Entry(top, textvariable=self.folder_var, width=65)
         self.folder_entry.pack(side="left", padx=(6, 6))
         ttk.Button(top, text="フォルダ選択", command=self.on_select_folder).pack(side="left", padx=3)
-        ttk.Button(top, text="再読み込み/再計算", command=self.on_reload).pack(side="left", padx=3)
-        ttk.Button(top, text="CSV出力", command=self.on_export_csv).pack(side="left", padx=3)
-        ttk.Button(top, text="LOG保存(CTESTWIN化)", command=self.on_export_logs_ctestwin).pack(side="left", padx=3)
-        ttk.Button(top, text="発表用CSV出力(部門別+総合)", command=self.on_export_results).pack(side="left", padx=3)
-        ttk.Button(top, text="コメント一覧CSV", command=self.on_export_comments_list).pack(side="left", padx=3)
-        ttk.Button(top, text="入賞抽出CSV", command=self.on_export_awards).pack(side="left", padx=3)
-        ttk.Button(top, text="発表HTML出力(部門別+総合)", command=self.on_export_html).pack(side="left", padx=3)
-
-        # ★追加：証書PDF
-        ttk.Button(top, text="賞状PDF出力（入賞）", command=self.on_export_award_pdfs).pack(side="left", padx=(18, 3))
-        ttk.Button(top, text="参加証PDF出力（参加者全員）", command=self.on_export_entry_pdfs).pack(side="left", padx=3)
-
-        ttk.Button(top, text="手動訂正", command=self.on_manual_edit_selected).pack(side="left", padx=(18, 3))
-        ttk.Button(top, text="訂正クリア", command=self.on_manual_clear_selected).pack(side="left", padx=3)
+        # 出力中は二重に起動されないよう、また出力中の entries を書き換えないよう、
+        # 出力系と entries を変更する操作のボタンはまとめて無効化できるように控えておく
+        self._busy_buttons: List[ttk.Button] = []
+        btn = ttk.Button(top, text="再読み込み/再計算", command=self.on_reload)
+        btn.pack(side="left", padx=3)
+        self._busy_buttons.append(btn)
+        for text, command, padx in (
+            ("CSV出力", self.on_export_csv, 3),
+            ("LOG保存(CTESTWIN化)", self.on_export_logs_ctestwin, 3),
+            ("発表用CSV出力(部門別+総合)", self.on_export_results, 3),
+            ("コメント一覧CSV", self.on_export_comments_list, 3),
+            ("入賞抽出CSV", self.on_export_awards, 3),
+            ("発表HTML出力(部門別+総合)", self.on_export_html, 3),
+            # ★追加：証書PDF
+            ("賞状PDF出力（入賞）", self.on_export_award_pdfs, (18, 3)),
+            ("参加証PDF出力（参加者全員）", self.on_export_entry_pdfs, 3),
+        ):
+            btn = ttk.Button(top, text=text, command=command)
+            btn.pack(side="left", padx=padx)
+            self._busy_buttons.append(btn)
+        ttk.Checkbutton(top, text="PDFを全て作り直す", variable=self.pdf_force_var).pack(side="left", padx=3)
+
+        for text, command, padx in (
+            ("手動訂正", self.on_manual_edit_selected, (18, 3)),
+            ("訂正クリア", self.on_manual_clear_selected, 3),
+        ):
+            btn = ttk.Button(top, text=text, command=command)
+            btn.pack(side="left", padx=padx)
+            self._busy_buttons.append(btn)
 
         paste_frame = ttk.LabelFrame(self, text="LOGSHEET貼り付け（任意：ファイルが無い局をここから追加）")
         paste_frame.pack(fill="x", padx=10, pady=(0, 8))
@@ -1590,7 +2171,9 @@ class App(tk.Tk):
         ttk.Label(row1, text="運用地（任意）:").pack(side="left")
         ttk.Entry(row1, textvariable=self.opplace_var, width=60).pack(side="left", padx=(6, 10))
 
-        ttk.Button(row1, text="貼り付け内容を追加", command=self.on_add_paste).pack(side="left", padx=4)
+        btn = ttk.Button(row1, text="貼り付け内容を追加", command=self.on_add_paste)
+        btn.pack(side="left", padx=4)
+        self._busy_buttons.append(btn)
         ttk.Button(row1, text="入力欄クリア", command=self.on_clear_paste).pack(side="left", padx=4)
 
         self.paste_text = tk.Text(paste_frame, height=7, wrap="none")
@@ -1702,6 +2285,8 @@ class App(tk.Tk):
         self.opplace_var.set("")
 
     def on_add_paste(self) -> None:
+        if not self._check_not_busy("貼り付け追加"):
+            return
         text = self.paste_text.get("1.0", "end-1c").strip()
         if not text:
             messagebox.showwarning("不足", "貼り付け欄が空です。")
@@ -1739,6 +2324,7 @@ class App(tk.Tk):
                 source_name="(貼り付け追加)"
             )
             self.entries[entry.callsign] = entry
+            self._entries_changed()
 
             self.apply_overrides_to_entries()
             self.refresh_table()
@@ -1752,41 +2338,48 @@ class App(tk.Tk):
             messagebox.showerror("解析エラー", f"貼り付け内容の解析に失敗しました。\n\n{e}")
 
     def on_reload(self) -> None:
+        if not self._check_not_busy("再読み込み"):
+            return
         folder = self.folder_var.get().strip()
         if not folder or not os.path.isdir(folder):
             messagebox.showwarning("フォルダ", "有効なフォルダを選択してください。")
             return
 
-        new_entries: Dict[str, StationEntry] = {}
-        errors: List[str] = []
+        try:
+            files = _list_submission_files(folder)
+        except OSError as ex:
+            messagebox.showwarning("フォルダ", f"フォルダを読み込めません。\n\n{ex}")
+            return
 
-        patterns = ["*.log", "*.txt", "*.dat", "*.adi", "*.sum", "*.xml"]
-        files = []
-        for p in patterns:
-            files.extend(glob.glob(os.path.join(folder, p)))
-        files = sorted(set(files))
+        # 解析は別スレッドで行い、結果の反映（self.entries / 一覧の更新）は Tk のスレッドで行う
+        # 終わるまでは再読込・出力・訂正を受け付けない（2本目の読込が結果を入れ違いに反映しないように）
+        self.status_var.set(f"読込中…（{len(files)}ファイル）")
+        self._set_busy(True)
 
-        for fp in files:
+        def work() -> None:
             try:
-                with open(fp, "r", encoding="utf-8", errors="ignore") as f:
-                    text = f.read()
-                entry = build_station_entry_from_text(
-                    text=text,
-                    fallback_callsign="",
-                    fallback_opplace="",
-                    source_name=os.path.basename(fp)
-                )
-                if entry.callsign:
-                    new_entries[entry.callsign] = entry
-            except Exception as e:
-                errors.append(f"{os.path.basename(fp)}: {e}")
+                loaded, errors = load_submission_files(files)
+            except Exception as ex:
+                loaded, errors = [], [f"{folder}: {ex}"]
+            self.after(0, lambda: self._on_reload_done(folder, loaded, errors))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _on_reload_done(self, folder: str, loaded: List[StationEntry], errors: List[str]) -> None:
+        self._set_busy(False)
+        new_entries: Dict[str, StationEntry] = {}
+        for entry in loaded:
+            if entry.callsign:
+                new_entries[entry.callsign] = entry
 
         self.entries.update(new_entries)
-        self.apply_overrides_to_entries()
+        # 読込中にフォルダ欄が書き換えられても、読み込んだフォルダの manual_overrides.json を使う
+        self.apply_overrides_to_entries(folder)
 
         # ★チェックログ再判定
         for e in self.entries.values():
             e.is_checklog = (e.callsign in CHECKLOG_CALLSIGNS)
+        self._entries_changed()
 
         self.refresh_table()
 
@@ -1797,45 +2390,27 @@ class App(tk.Tk):
         msg = f"完了: Summary={len(self.entries)}局 / OK={ok} / 差あり={ng} / 手動訂正={manual} / CHECKLOG={checklog}"
         if errors:
             msg += f" / 読込エラー={len(errors)}（詳細はコンソール）"
-            print("---- load errors ----")
-            for x in errors[:200]:
-                print(x)
+            _log_errors("load errors", errors)
         self.status_var.set(msg)
 
     def refresh_table(self) -> None:
         self.tree.delete(*self.tree.get_children())
-        entries_sorted = sorted(self.entries.values(), key=lambda e: e.callsign)
+        entries_sorted = self._sorted_entries()
 
+        insert = self.tree.insert
         for e in entries_sorted:
-            match_txt = "OK" if e.match else "差あり"
-            cat_disp = category_display(e.category or "")
-
-            if e.is_checklog:
-                tag = "checklog"
-                match_txt = "CHECKLOG"
-            elif e.manual_enabled:
-                tag = "manual"
-            else:
-                tag = "good" if e.match else "bad"
-
-            self.tree.insert(
-                "",
-                "end",
-                iid=e.callsign,
-                values=(
-                    e.callsign,
-                    cat_disp,
-                    e.opplace or "",
-                    e.recalced_qso,
-                    e.recalced_pts,
-                    e.recalced_mult,
-                    e.recalced_total,
-                    _safe_int(e.claimed_total, 0) if e.claimed_total is not None else "",
-                    match_txt,
-                    e.reason or "",
-                ),
-                tags=(tag,)
-            )
+            values, tag = _table_row(e)
+            insert("", "end", iid=e.callsign, values=values, tags=(tag,))
+
+    def _refresh_row(self, e: StationEntry) -> None:
+        """
+        1局分の行だけ書き換える（並び順はコールサインなので変わらない）
+        """
+        if not self.tree.exists(e.callsign):
+            self.refresh_table()
+            return
+        values, tag = _table_row(e)
+        self.tree.item(e.callsign, values=values, tags=(tag,))
 
     def _get_selected_callsign(self) -> Optional[str]:
         item = self.tree.focus()
@@ -1846,6 +2421,8 @@ class App(tk.Tk):
         return item or None
 
     def on_manual_edit_selected(self) -> None:
+        if not self._check_not_busy("手動訂正"):
+            return
         cs = self._get_selected_callsign()
         if not cs:
             messagebox.showinfo("手動訂正", "一覧から局を選択してください。")
@@ -1853,16 +2430,34 @@ class App(tk.Tk):
         e = self.entries.get(cs)
         if not e:
             return
-        ManualEditDialog(self, e, on_saved=self._on_manual_saved)
-
-    def _on_manual_saved(self) -> None:
-        for e in self.entries.values():
-            recalc_entry(e)
+        ManualEditDialog(self, e, on_saved=self._on_manual_saved,
+                         can_save=lambda: self._check_not_busy("手動訂正"))
+
+    def _on_manual_saved(self, changed: StationEntry) -> None:
+        # 再計算はダイアログ側で changed だけ済んでいる（他局の得点は変わらない）
+        # ダイアログを開いている間に再読み込みされた場合、changed はもう self.entries に無いので、
+        # 訂正内容を今の同じ局へ写して再計算する
+        current = self.entries.get(changed.callsign)
+        if current is None:
+            self.refresh_table()
+            self.status_var.set(f"{changed.callsign} は一覧に無いため、手動訂正は保存されませんでした")
+            return
+        if current is not changed:
+            current.manual_enabled = changed.manual_enabled
+            current.manual_qso = changed.manual_qso
+            current.manual_pts = changed.manual_pts
+            current.manual_mult = changed.manual_mult
+            current.manual_total = changed.manual_total
+            current.manual_note = changed.manual_note
+            current.manual_opplace = changed.manual_opplace
+            recalc_entry(current)
         self.save_overrides()
-        self.refresh_table()
+        self._refresh_row(current)
         self.status_var.set("手動訂正を保存しました（manual_overrides.json）")
 
     def on_manual_clear_selected(self) -> None:
+        if not self._check_not_busy("訂正クリア"):
+            return
         cs = self._get_selected_callsign()
         if not cs:
             messagebox.showinfo("訂正クリア", "一覧から局を選択してください。")
@@ -1884,7 +2479,7 @@ class App(tk.Tk):
         e.manual_opplace = ""
         recalc_entry(e)
         self.save_overrides()
-        self.refresh_table()
+        self._refresh_row(e)
         self.status_var.set(f"{cs} の手動訂正を削除しました")
 
     def on_open_detail(self, event=None) -> None:
@@ -1901,6 +2496,42 @@ class App(tk.Tk):
     # ※ここは元のまま（あなたの得点ロジックは触っていません）
     # ただし、PDF追加のためにこの下にPDF出力関数だけ追加します
 
+    def _set_busy(self, busy: bool) -> None:
+        self._busy = busy
+        state = ["disabled"] if busy else ["!disabled"]
+        for btn in self._busy_buttons:
+            btn.state(state)
+
+    def _check_not_busy(self, title: str) -> bool:
+        """
+        読込・出力の実行中なら知らせて False（右クリックメニューや開いたままの訂正ダイアログからの操作もここで止める）
+        """
+        if self._busy:
+            messagebox.showinfo(title, "読込・出力の実行中です。終わってから操作してください。")
+            return False
+        return True
+
+    def _run_export(self, status: str, work, done) -> None:
+        """
+        出力処理 work() を別スレッドで行い、終わったら done(結果, 例外) を Tk のスレッドで呼ぶ
+        実行中は出力系と entries を変更する操作を無効化する（作業スレッドが読む局データを書き換えない）
+        """
+        self.status_var.set(status)
+        self._set_busy(True)
+
+        def finish(result: Any, err: Optional[BaseException]) -> None:
+            self._set_busy(False)
+            done(result, err)
+
+        def run() -> None:
+            try:
+                result, err = work(), None
+            except Exception as ex:
+                result, err = None, ex
+            self.after(0, lambda: finish(result, err))
+
+        threading.Thread(target=run, daemon=True).start()
+
     def on_export_logs_ctestwin(self) -> None:
         if not self.entries:
             messagebox.showinfo("LOG保存", "出力するデータがありません。")
@@ -1913,57 +2544,87 @@ class App(tk.Tk):
         if not out_dir:
             return
 
-        saved = 0
-        skipped = 0
-        errors: List[str] = []
-
-        for e in sorted(self.entries.values(), key=lambda x: x.callsign):
-            try:
-                base_text = e.raw_submission_text or ""
-
-                if base_text.strip():
-                    out_text = replace_logsheet_with_ctestwin(base_text, e)
-                else:
-                    lines = "\n".join([qso_to_ctestwin_line(q) for q in (e.qsos or [])])
-                    out_text = (
-                        "<SUMMARYSHEET VERSION=R1.0>\n"
-                        f"<CALLSIGN>{e.callsign}</CALLSIGN>\n"
-                        f"<CATEGORYCODE>{e.category}</CATEGORYCODE>\n"
-                        f"<CATEGORYNAME>{e.category_name}</CATEGORYNAME>\n"
-                        f"<OPPLACE>{e.opplace}</OPPLACE>\n"
-                        f"<TOTALSCORE>{_safe_int(e.claimed_total, 0) if e.claimed_total is not None else 0}</TOTALSCORE>\n"
-                        "</SUMMARYSHEET>\n"
-                        "<LOGSHEET TYPE=CTESTWIN>\n"
-                        f"{lines}\n"
-                        "</LOGSHEET>\n"
-                    )
-
-                safe_cs = re.sub(r'[\\/:*?"<>|]+', "_", e.callsign)
-                out_name = f"{safe_cs}.log"
-                out_path = os.path.join(out_dir, out_name)
-
-                if os.path.exists(out_path):
-                    if not messagebox.askyesno("上書き確認", f"既に存在します。\n上書きしますか？\n\n{out_path}"):
-                        skipped += 1
-                        continue
+        # 既存ファイルは最初に1回だけ調べ、上書きするかどうかも1回だけ確認する
+        try:
+            existing = {os.path.normcase(n) for n in os.listdir(out_dir)}
+        except OSError:
+            existing = set()
+        n_conflicts = sum(
+            1 for e in self._sorted_entries()
+            if os.path.normcase(f"{_RE_UNSAFE_FN.sub('_', e.callsign)}.log") in existing
+        )
+        overwrite = True
+        if n_conflicts:
+            ans = messagebox.askyesnocancel(
+                "上書き確認",
+                f"保存先に同名の .log が {n_conflicts} 件あります。\n\n"
+                "はい：すべて上書き\nいいえ：既存のファイルはスキップ\nキャンセル：出力を中止"
+            )
+            if ans is None:
+                return
+            overwrite = ans
 
-                with open(out_path, "w", encoding="utf-8", newline="\n") as f:
-                    f.write(out_text)
+        entries = self._sorted_entries()
 
-                saved += 1
+        def work() -> Tuple[int, int, List[str]]:
+            saved = 0
+            skipped = 0
+            errors: List[str] = []
 
-            except Exception as ex:
-                errors.append(f"{e.callsign}: {ex}")
+            for e in entries:
+                try:
+                    safe_cs = _RE_UNSAFE_FN.sub("_", e.callsign)
+                    out_name = f"{safe_cs}.log"
+                    out_path = os.path.join(out_dir, out_name)
 
-        msg = f"LOG保存(CTESTWIN化) 完了: 保存={saved} / スキップ={skipped}"
-        if errors:
-            msg += f" / エラー={len(errors)}（詳細はコンソール）"
-            print("---- export log errors ----")
-            for x in errors[:200]:
-                print(x)
+                    if not overwrite and os.path.normcase(out_name) in existing:
+                        skipped += 1
+                        continue
 
-        self.status_var.set(msg)
-        messagebox.showinfo("LOG保存", msg)
+                    base_text = e.raw_submission_text or ""
+
+                    if base_text.strip():
+                        out_text = replace_logsheet_with_ctestwin(base_text, e)
+                    else:
+                        lines = "\n".join(map(qso_to_ctestwin_line, e.qsos or ()))
+                        out_text = (
+                            "<SUMMARYSHEET VERSION=R1.0>\n"
+                            f"<CALLSIGN>{e.callsign}</CALLSIGN>\n"
+                            f"<CATEGORYCODE>{e.category}</CATEGORYCODE>\n"
+                            f"<CATEGORYNAME>{e.category_name}</CATEGORYNAME>\n"
+                            f"<OPPLACE>{e.opplace}</OPPLACE>\n"
+                            f"<TOTALSCORE>{_safe_int(e.claimed_total, 0)}</TOTALSCORE>\n"
+                            "</SUMMARYSHEET>\n"
+                            "<LOGSHEET TYPE=CTESTWIN>\n"
+                            f"{lines}\n"
+                            "</LOGSHEET>\n"
+                        )
+
+                    # 本文は改行が "\n" にそろっているので、まとめてエンコードしてバイナリで1回で書く
+                    data = out_text.encode("utf-8")
+                    with open(out_path, "wb") as f:
+                        f.write(data)
+
+                    saved += 1
+
+                except Exception as ex:
+                    errors.append(f"{e.callsign}: {ex}")
+            return saved, skipped, errors
+
+        def done(result: Optional[Tuple[int, int, List[str]]], err: Optional[BaseException]) -> None:
+            if err is not None:
+                messagebox.showerror("LOG保存", str(err))
+                return
+            saved, skipped, errors = result
+            msg = f"LOG保存(CTESTWIN化) 完了: 保存={saved} / スキップ={skipped}"
+            if errors:
+                msg += f" / エラー={len(errors)}（詳細はコンソール）"
+                _log_errors("export log errors", errors)
+
+            self.status_var.set(msg)
+            messagebox.showinfo("LOG保存", msg)
+
+        self._run_export("LOG保存(CTESTWIN化)中…", work, done)
 
     def on_export_csv(self) -> None:
         if not self.entries:
@@ -1988,12 +2649,14 @@ class App(tk.Tk):
             "manual_opplace",
             "match", "reason", "source"
         ]
-        try:
-            with open(fp, "w", encoding="utf-8-sig", newline="") as f:
+        entries = self._sorted_entries()
+
+        def work() -> None:
+            with open(fp, "w", encoding="utf-8-sig", newline="", buffering=EXPORT_WRITE_BUFFER) as f:
                 w = csv.writer(f)
                 w.writerow(cols)
-                for e in sorted(self.entries.values(), key=lambda x: x.callsign):
-                    w.writerow([
+                w.writerows([
+                    [
                         e.callsign,
                         e.category,
                         e.opplace,
@@ -2012,13 +2675,20 @@ class App(tk.Tk):
                         "OK" if e.match else "NG",
                         e.reason,
                         e.source_name
-                    ])
+                    ]
+                    for e in entries
+                ])
+
+        def done(_result: None, err: Optional[BaseException]) -> None:
+            if err is not None:
+                messagebox.showerror("CSV出力エラー", str(err))
+                return
             self.status_var.set(f"CSV出力: {fp}")
-        except Exception as ex:
-            messagebox.showerror("CSV出力エラー", str(ex))
+
+        self._run_export("CSV出力中…", work, done)
 
     def _csv_safe(self, s: str) -> str:
-        return re.sub(r"[\r\n\t]+", " ", (s or "")).strip()
+        return _RE_CSV_UNSAFE.sub(" ", (s or "")).strip()
 
     def on_export_results(self) -> None:
         if not self.entries:
@@ -2031,40 +2701,46 @@ class App(tk.Tk):
         if not out_dir:
             return
 
+        safe = self._csv_safe
+        all_for_rank = self._active_entries()
+        tuples = _award_tuples(all_for_rank)
+
         def write_csv(path: str, ranked: List[Tuple[int, StationEntry]]) -> None:
             cols = ["rank","callsign","categorycode","categoryname","opplace","valid_qso","pts","mult","total","manual_note","comments"]
-            with open(path, "w", encoding="utf-8-sig", newline="") as f:
-                w = csv.writer(f)
-                w.writerow(cols)
-                for rank, e in ranked:
-                    w.writerow([
+            with open(path, "w", encoding="utf-8-sig", newline="", buffering=EXPORT_WRITE_BUFFER) as f:
+                f.write(_csv_line(cols))
+                f.writelines(
+                    _csv_line((
                         rank,
-                        e.callsign,
-                        e.category or "",
-                        category_display(e.category or ""),
-                        e.opplace or "",
-                        int(e.recalced_qso),
-                        int(e.recalced_pts),
-                        int(e.recalced_mult),
-                        int(e.recalced_total),
-                        self._csv_safe(e.manual_note) if e.manual_enabled else "",
-                        self._csv_safe(e.comments),
-                    ])
-
-        overall_path = os.path.join(out_dir, "results_overall.csv")
-        all_for_rank = [e for e in self.entries.values() if not e.is_checklog]
-        write_csv(overall_path, rank_entries(all_for_rank))
-
-        cats = sorted({(e.category or "").strip() for e in all_for_rank if (e.category or "").strip()})
-        for cat in cats:
-            es = [e for e in all_for_rank if (e.category or "").strip() == cat]
-            if not es:
-                continue
-            out_name = f"results_by_category_{cat}.csv"
-            write_csv(os.path.join(out_dir, out_name), rank_entries(es))
+                        *tuples[e.callsign],
+                        safe(e.manual_note) if e.manual_enabled else "",
+                        safe(e.comments),
+                    ))
+                    for rank, e in ranked
+                )
 
-        self.status_var.set(f"発表用CSV出力: {out_dir}")
-        messagebox.showinfo("発表用CSV", "出力しました。\n\n- results_overall.csv\n- results_by_category_<CATEGORYCODE>.csv")
+        def work() -> None:
+            overall_path = os.path.join(out_dir, "results_overall.csv")
+            write_csv(overall_path, rank_entries(all_for_rank))
+
+            by_cat: Dict[str, List[StationEntry]] = {}
+            for e in all_for_rank:
+                cat = (e.category or "").strip()
+                if cat:
+                    by_cat.setdefault(cat, []).append(e)
+            for cat in sorted(by_cat):
+                es = by_cat[cat]
+                out_name = f"results_by_category_{cat}.csv"
+                write_csv(os.path.join(out_dir, out_name), rank_entries(es))
+
+        def done(_result: None, err: Optional[BaseException]) -> None:
+            if err is not None:
+                messagebox.showerror("発表用CSV", str(err))
+                return
+            self.status_var.set(f"発表用CSV出力: {out_dir}")
+            messagebox.showinfo("発表用CSV", "出力しました。\n\n- results_overall.csv\n- results_by_category_<CATEGORYCODE>.csv")
+
+        self._run_export("発表用CSV出力中…", work, done)
 
     def on_export_comments_list(self) -> None:
         if not self.entries:
@@ -2078,24 +2754,33 @@ class App(tk.Tk):
             return
         path = os.path.join(out_dir, "comments_list.csv")
         cols = ["callsign","categorycode","categoryname","opplace","comments"]
-        try:
-            with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        entries = self._sorted_entries()
+
+        def work() -> None:
+            with open(path, "w", encoding="utf-8-sig", newline="", buffering=EXPORT_WRITE_BUFFER) as f:
                 w = csv.writer(f)
                 w.writerow(cols)
-                for e in sorted(self.entries.values(), key=lambda x: x.callsign):
-                    if e.is_checklog:
-                        continue
-                    w.writerow([
+                csv_safe = self._csv_safe
+                w.writerows([
+                    [
                         e.callsign,
                         e.category or "",
                         category_display(e.category or ""),
                         e.opplace or "",
-                        self._csv_safe(e.comments),
-                    ])
+                        csv_safe(e.comments),
+                    ]
+                    for e in entries
+                    if not e.is_checklog
+                ])
+
+        def done(_result: None, err: Optional[BaseException]) -> None:
+            if err is not None:
+                messagebox.showerror("コメント一覧CSV出力エラー", str(err))
+                return
             self.status_var.set(f"コメント一覧CSV出力: {path}")
             messagebox.showinfo("コメント一覧CSV", "出力しました。\n\n- comments_list.csv")
-        except Exception as ex:
-            messagebox.showerror("コメント一覧CSV出力エラー", str(ex))
+
+        self._run_export("コメント一覧CSV出力中…", work, done)
 
     def on_export_awards(self) -> None:
         if not self.entries:
@@ -2108,53 +2793,52 @@ class App(tk.Tk):
         if not out_dir:
             return
 
-        all_entries = [e for e in self.entries.values() if not e.is_checklog]
+        all_entries = self._active_entries()
 
-        rows_in, rows_out = build_award_lists(all_entries)
+        def work() -> None:
+            rows_in, rows_out = build_award_lists(all_entries)
+            safe = self._csv_safe
+            tuples = _award_tuples([e for _, _, e in rows_in] + [e for _, _, e in rows_out])
 
-        path_in1 = os.path.join(out_dir, "awards_in1_by_category.csv")
-        cols_in1 = ["categorycode","rank","callsign","categoryname","opplace","valid_qso","pts","mult","total","manual_note","comments"]
-        with open(path_in1, "w", encoding="utf-8-sig", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(cols_in1)
-            for cat, rank, e in rows_in:
-                w.writerow([
-                    cat,
-                    rank,
-                    e.callsign,
-                    category_display(e.category or ""),
-                    e.opplace or "",
-                    int(e.recalced_qso),
-                    int(e.recalced_pts),
-                    int(e.recalced_mult),
-                    int(e.recalced_total),
-                    self._csv_safe(e.manual_note) if e.manual_enabled else "",
-                    self._csv_safe(e.comments),
-                ])
+            path_in1 = os.path.join(out_dir, "awards_in1_by_category.csv")
+            cols_in1 = ["categorycode","rank","callsign","categoryname","opplace","valid_qso","pts","mult","total","manual_note","comments"]
+            with open(path_in1, "w", encoding="utf-8-sig", newline="", buffering=EXPORT_WRITE_BUFFER) as f:
+                f.write(_csv_line(cols_in1))
+                f.writelines(
+                    _csv_line((
+                        cat,
+                        rank,
+                        tuples[e.callsign][0],
+                        *tuples[e.callsign][2:],
+                        safe(e.manual_note) if e.manual_enabled else "",
+                        safe(e.comments),
+                    ))
+                    for cat, rank, e in rows_in
+                )
 
-        path_out = os.path.join(out_dir, "awards_1x_by_area.csv")
-        cols_out = ["area","rank","callsign","categorycode","categoryname","opplace","valid_qso","pts","mult","total","manual_note","comments"]
-        with open(path_out, "w", encoding="utf-8-sig", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(cols_out)
-            for d, rank, e in rows_out:
-                w.writerow([
-                    d,
-                    rank,
-                    e.callsign,
-                    e.category or "",
-                    category_display(e.category or ""),
-                    e.opplace or "",
-                    int(e.recalced_qso),
-                    int(e.recalced_pts),
-                    int(e.recalced_mult),
-                    int(e.recalced_total),
-                    self._csv_safe(e.manual_note) if e.manual_enabled else "",
-                    self._csv_safe(e.comments),
-                ])
+            path_out = os.path.join(out_dir, "awards_1x_by_area.csv")
+            cols_out = ["area","rank","callsign","categorycode","categoryname","opplace","valid_qso","pts","mult","total","manual_note","comments"]
+            with open(path_out, "w", encoding="utf-8-sig", newline="", buffering=EXPORT_WRITE_BUFFER) as f:
+                f.write(_csv_line(cols_out))
+                f.writelines(
+                    _csv_line((
+                        d,
+                        rank,
+                        *tuples[e.callsign],
+                        safe(e.manual_note) if e.manual_enabled else "",
+                        safe(e.comments),
+                    ))
+                    for d, rank, e in rows_out
+                )
+
+        def done(_result: None, err: Optional[BaseException]) -> None:
+            if err is not None:
+                messagebox.showerror("入賞抽出CSV", str(err))
+                return
+            self.status_var.set(f"入賞抽出CSV: {out_dir}")
+            messagebox.showinfo("入賞抽出CSV", "出力しました。\n\n- awards_in1_by_category.csv\n- awards_1x_by_area.csv")
 
-        self.status_var.set(f"入賞抽出CSV: {out_dir}")
-        messagebox.showinfo("入賞抽出CSV", "出力しました。\n\n- awards_in1_by_category.csv\n- awards_1x_by_area.csv")
+        self._run_export("入賞抽出CSV出力中…", work, done)
 
     def on_export_html(self) -> None:
         if not self.entries:
@@ -2167,91 +2851,112 @@ class App(tk.Tk):
         if not out_dir:
             return
 
-        entries_all = [e for e in self.entries.values() if not e.is_checklog]
-        overall_sorted = sorted(entries_all, key=_rank_sort_key)
-        overall_ranked = _competition_ranks(overall_sorted)
+        entries_all = self._active_entries()
+        path_out = os.path.join(out_dir, "publish_results.html")
 
-        def row_basic(rank: int, e: StationEntry) -> List[Any]:
-            return [
-                rank,
-                e.callsign,
-                category_display(e.category or ""),
-                e.opplace or "",
-                e.recalced_qso,
-                e.recalced_pts,
-                e.recalced_mult,
-                e.recalced_total,
-            ]
+        def work() -> None:
+            overall_sorted = sorted(entries_all, key=_rank_sort_key)
+            overall_ranked = _competition_ranks(overall_sorted)
 
-        body = []
-        body.append("<p class='meta'>※ 同点は同順位（総得点が同じ局は同順位）。HTMLはブラウザで開いて、そのまま印刷→PDF保存できます。</p>")
+            # 各局は総合・部門別・入賞の表に何度も出るので、表示用の値は1局1回だけ作る
+            tuples = _award_tuples(entries_all)
 
-        body.append("<div class='toc'>"
-                    "<a href='#awards_in'>入賞（1F/1P/1Q/SWL：部門別上位3位）</a>"
-                    "<a href='#awards_1x'>入賞（1X：各エリア1位）</a>"
-                    "<a href='#overall'>総合結果</a>"
-                    "<a href='#bycat'>部門別結果</a>"
-                    "<a href='#comments'>コメント一覧</a>"
-                    "</div>")
+            # 同じ局・部門名が複数の表に出るので、エスケープ結果はページ全体で共有する
+            esc_cache: Dict[str, str] = {}
 
-        rows_in, rows_out = build_award_lists(entries_all)
+            def row_basic(rank: int, e: StationEntry) -> List[Any]:
+                t = tuples[e.callsign]
+                return [rank, t[0], *t[2:]]
 
-        body.append("<h2 id='awards_in'>入賞（1F/1P/1Q/SWL：各部門 上位3位まで）</h2>")
-        if not rows_in:
-            body.append("<p class='small'>対象局なし</p>")
-        else:
-            headers = ["順位", "コール", "部門", "運用地", "有効QSO", "素点", "マルチ", "総得点"]
-            for cat in sorted({cat for cat, _, _ in rows_in}):
-                body.append(f"<h3>{_h(category_display(cat))}</h3>")
-                winners = [(r, e) for (c, r, e) in rows_in if c == cat]
-                rows = [row_basic(r, e) for r, e in winners]
-                body.append(_html_table(headers, rows))
+            body = []
+            body.append("<p class='meta'>※ 同点は同順位（総得点が同じ局は同順位）。HTMLはブラウザで開いて、そのまま印刷→PDF保存できます。</p>")
 
-        body.append("<h2 id='awards_1x'>入賞（1X：各エリア1位）</h2>")
-        if not rows_out:
-            body.append("<p class='small'>対象局なし</p>")
-        else:
+            body.append("<div class='toc'>"
+                        "<a href='#awards_in'>入賞（1F/1P/1Q/SWL：部門別上位3位）</a>"
+                        "<a href='#awards_1x'>入賞（1X：各エリア1位）</a>"
+                        "<a href='#overall'>総合結果</a>"
+                        "<a href='#bycat'>部門別結果</a>"
+                        "<a href='#comments'>コメント一覧</a>"
+                        "</div>")
+
+            rows_in, rows_out = build_award_lists(entries_all)
+
+            body.append("<h2 id='awards_in'>入賞（1F/1P/1Q/SWL：各部門 上位3位まで）</h2>")
+            if not rows_in:
+                body.append("<p class='small'>対象局なし</p>")
+            else:
+                headers = ["順位", "コール", "部門", "運用地", "有効QSO", "素点", "マルチ", "総得点"]
+                awards_by_cat: Dict[str, List[Tuple[int, StationEntry]]] = {}
+                for c, r, e in rows_in:
+                    awards_by_cat.setdefault(c, []).append((r, e))
+                for cat in sorted(awards_by_cat):
+                    body.append(f"<h3>{_h(category_display(cat))}</h3>")
+                    rows = [row_basic(r, e) for r, e in awards_by_cat[cat]]
+                    body.append(_html_table(headers, rows, esc_cache))
+
+            body.append("<h2 id='awards_1x'>入賞（1X：各エリア1位）</h2>")
+            if not rows_out:
+                body.append("<p class='small'>対象局なし</p>")
+            else:
+                headers = ["順位", "コール", "部門", "運用地", "有効QSO", "素点", "マルチ", "総得点"]
+                awards_by_area: Dict[int, List[Tuple[int, StationEntry]]] = {}
+                for d, r, e in rows_out:
+                    awards_by_area.setdefault(d, []).append((r, e))
+                for d in sorted(awards_by_area):
+                    body.append(f"<h3>{d}エリア</h3>")
+                    rows = [row_basic(r, e) for r, e in awards_by_area[d]]
+                    body.append(_html_table(headers, rows, esc_cache))
+
+            body.append("<h2 id='overall'>総合結果</h2>")
             headers = ["順位", "コール", "部門", "運用地", "有効QSO", "素点", "マルチ", "総得点"]
-            for d in sorted({d for d, _, _ in rows_out}):
-                body.append(f"<h3>{d}エリア</h3>")
-                winners = [(r, e) for (dd, r, e) in rows_out if dd == d]
-                rows = [row_basic(r, e) for r, e in winners]
-                body.append(_html_table(headers, rows))
-
-        body.append("<h2 id='overall'>総合結果</h2>")
-        headers = ["順位", "コール", "部門", "運用地", "有効QSO", "素点", "マルチ", "総得点"]
-        rows = [row_basic(r, e) for r, e in overall_ranked]
-        body.append(_html_table(headers, rows))
-
-        body.append("<h2 id='bycat'>部門別結果</h2>")
-        cats_all = sorted({(e.category or "") for e in entries_all if (e.category or "").strip()})
-        for cat in cats_all:
-            es = [e for e in entries_all if (e.category or "") == cat]
-            es_sorted = sorted(es, key=_rank_sort_key)
-            ranked = _competition_ranks(es_sorted)
-            body.append(f"<h3>{_h(category_display(cat))}</h3>")
-            rows = [row_basic(r, e) for r, e in ranked]
-            body.append(_html_table(headers, rows))
-
-        body.append("<h2 id='comments'>コメント一覧</h2>")
-        coms = [(e.callsign, (e.comments or "").strip()) for e in entries_all if (e.comments or "").strip()]
-        if not coms:
-            body.append("<p class='small'>コメントなし</p>")
-        else:
-            coms.sort(key=lambda x: x[0])
-            body.append("<table class='tbl'><thead><tr><th>コール</th><th>コメント</th></tr></thead><tbody>" +
-                        "".join([f"<tr><td>{_h(cs)}</td><td>{_h(c).replace(chr(10), '<br>')}</td></tr>" for cs, c in coms]) +
-                        "</tbody></table>")
+            rows = [row_basic(r, e) for r, e in overall_ranked]
+            body.append(_html_table(headers, rows, esc_cache))
+
+            body.append("<h2 id='bycat'>部門別結果</h2>")
+            by_cat: Dict[str, List[StationEntry]] = {}
+            for e in entries_all:
+                by_cat.setdefault(e.category or "", []).append(e)
+            for cat in sorted(k for k in by_cat if k.strip()):
+                es_sorted = sorted(by_cat[cat], key=_rank_sort_key)
+                ranked = _competition_ranks(es_sorted)
+                body.append(f"<h3>{_h(category_display(cat))}</h3>")
+                rows = [row_basic(r, e) for r, e in ranked]
+                body.append(_html_table(headers, rows, esc_cache))
 
-        html_out = _html_page("コンテスト結果（発表用）", "\n".join(body))
-        path_out = os.path.join(out_dir, "publish_results.html")
-        try:
-            with open(path_out, "w", encoding="utf-8", newline="\n") as f:
-                f.write(html_out)
+            body.append("<h2 id='comments'>コメント一覧</h2>")
+            coms = [(e.callsign, (e.comments or "").strip()) for e in entries_all if (e.comments or "").strip()]
+            if not coms:
+                body.append("<p class='small'>コメントなし</p>")
+            else:
+                coms.sort(key=lambda x: x[0])
+
+            # ページ全体を1つの文字列にせず、見出し・本文の各部分・コメント行を順にバッファへ書き出す
+            with open(path_out, "w", encoding="utf-8", newline="\n", buffering=EXPORT_WRITE_BUFFER) as f:
+                w = f.write
+                w(_html_page_head("コンテスト結果（発表用）"))
+                w(body[0])
+                for chunk in body[1:]:
+                    w("\n")
+                    w(chunk)
+                if coms:
+                    w("\n<table class='tbl'><thead><tr><th>コール</th><th>コメント</th></tr></thead><tbody>")
+                    for cs, c in coms:
+                        w("<tr><td>")
+                        w(_h(cs))
+                        w("</td><td>")
+                        w(_h(c).replace("\n", "<br>"))
+                        w("</td></tr>")
+                    w("</tbody></table>")
+                w(_HTML_TAIL)
+
+        def done(_result: None, err: Optional[BaseException]) -> None:
+            if err is not None:
+                messagebox.showerror("発表HTML", str(err))
+                return
             self.status_var.set(f"発表HTML出力: {path_out}")
             messagebox.showinfo("発表HTML", f"出力しました。\n\n{path_out}\n\nブラウザで開いて印刷すればPDFにもできます。")
-        except Exception as ex:
-            messagebox.showerror("発表HTML", str(ex))
+
+        self._run_export("発表HTML出力中…", work, done)
 
     # -----------------------------
     # ★新機能：賞状/参加証 PDF 出力
@@ -2278,10 +2983,10 @@ class App(tk.Tk):
             )
             bg_path = ""
 
-        all_entries = [e for e in self.entries.values() if not e.is_checklog]
+        all_entries = self._active_entries()
         rows_in, rows_out = build_award_lists(all_entries)
 
-        saved = 0
+        jobs: List[AwardJob] = []
         errors: List[str] = []
 
         # 1F/1P/1Q/SWL
@@ -2289,16 +2994,7 @@ class App(tk.Tk):
             try:
                 fn = f"award_{_safe_filename(e.callsign)}_{cat}_R{rank}.pdf"
                 path = os.path.join(out_dir, fn)
-                generate_award_pdf_one(
-                    out_path=path,
-                    bg_path=bg_path,
-                    callsign=e.callsign,
-                    year=CONTEST_YEAR,
-                    category_code=cat,
-                    rank=rank,
-                    total_score=int(e.recalced_total),
-                )
-                saved += 1
+                jobs.append((path, bg_path, e.callsign, CONTEST_YEAR, cat, rank, int(e.recalced_total)))
             except Exception as ex:
                 errors.append(f"{e.callsign}: {ex}")
 
@@ -2307,28 +3003,42 @@ class App(tk.Tk):
             try:
                 fn = f"award_{_safe_filename(e.callsign)}_1X_area{area}_R{rank}.pdf"
                 path = os.path.join(out_dir, fn)
-                generate_award_pdf_one(
-                    out_path=path,
-                    bg_path=bg_path,
-                    callsign=e.callsign,
-                    year=CONTEST_YEAR,
-                    category_code="1X",
-                    rank=rank,
-                    total_score=int(e.recalced_total),
-                )
-                saved += 1
+                jobs.append((path, bg_path, e.callsign, CONTEST_YEAR, "1X", rank, int(e.recalced_total)))
             except Exception as ex:
                 errors.append(f"{e.callsign}: {ex}")
 
-        msg = f"賞状PDF出力 完了: {saved}枚"
-        if errors:
-            msg += f" / エラー={len(errors)}（詳細はコンソール）"
-            print("---- award pdf errors ----")
-            for x in errors[:200]:
-                print(x)
+        def done(saved: int, skipped: int, render_errors: List[str]) -> None:
+            all_errors = errors + render_errors
+            msg = f"賞状PDF出力 完了: {saved}枚"
+            if skipped:
+                msg += f" / 変更なし={skipped}枚"
+            if all_errors:
+                msg += f" / エラー={len(all_errors)}（詳細はコンソール）"
+                _log_errors("award pdf errors", all_errors)
 
-        self.status_var.set(msg)
-        messagebox.showinfo("賞状PDF", msg)
+            self.status_var.set(msg)
+            messagebox.showinfo("賞状PDF", msg)
+
+        self._run_pdf_jobs("賞状PDF出力", _render_award, jobs, done)
+
+    def _run_pdf_jobs(self, label: str, render, jobs: List[tuple], done) -> None:
+        """
+        PDF生成を別スレッドで行い、進捗をステータス欄に出し、終わったら done(saved, skipped, errors) を Tk のスレッドで呼ぶ
+        """
+        def progress(n_done: int, total: int) -> None:
+            self.after(0, lambda: self.status_var.set(f"{label}中…（{n_done}/{total}枚）"))
+
+        force = self.pdf_force_var.get()
+
+        def work() -> Tuple[int, int, List[str]]:
+            return render_pdfs(render, jobs, progress, force)
+
+        def finish(result: Optional[Tuple[int, int, List[str]]], err: Optional[BaseException]) -> None:
+            if err is not None:
+                result = (0, 0, [f"PDF: {err}"])
+            done(*result)
+
+        self._run_export(f"{label}中…（{len(jobs)}枚）", work, finish)
 
     def on_export_entry_pdfs(self) -> None:
         if not self.entries:
@@ -2351,43 +3061,40 @@ class App(tk.Tk):
             )
             bg_path = ""
 
-        saved = 0
+        jobs: List[EntryJob] = []
         errors: List[str] = []
 
-        for e in sorted(self.entries.values(), key=lambda x: x.callsign):
+        for e in self._sorted_entries():
             if e.is_checklog:
                 continue
             try:
                 fn = f"entry_{_safe_filename(e.callsign)}.pdf"
                 path = os.path.join(out_dir, fn)
-                generate_entry_pdf_one(
-                    out_path=path,
-                    bg_path=bg_path,
-                    callsign=e.callsign,
-                    year=CONTEST_YEAR,
-                    category_code=(e.category or "").strip(),
-                    total_score=int(e.recalced_total),
-                )
-                saved += 1
+                jobs.append((path, bg_path, e.callsign, CONTEST_YEAR, (e.category or "").strip(), int(e.recalced_total)))
             except Exception as ex:
                 errors.append(f"{e.callsign}: {ex}")
 
-        msg = f"参加証PDF出力 完了: {saved}枚"
-        if errors:
-            msg += f" / エラー={len(errors)}（詳細はコンソール）"
-            print("---- entry pdf errors ----")
-            for x in errors[:200]:
-                print(x)
+        def done(saved: int, skipped: int, render_errors: List[str]) -> None:
+            all_errors = errors + render_errors
+            msg = f"参加証PDF出力 完了: {saved}枚"
+            if skipped:
+                msg += f" / 変更なし={skipped}枚"
+            if all_errors:
+                msg += f" / エラー={len(all_errors)}（詳細はコンソール）"
+                _log_errors("entry pdf errors", all_errors)
 
-        self.status_var.set(msg)
-        messagebox.showinfo("参加証PDF", msg)
+            self.status_var.set(msg)
+            messagebox.showinfo("参加証PDF", msg)
+
+        self._run_pdf_jobs("参加証PDF出力", _render_entry, jobs, done)
 
 
 class ManualEditDialog(tk.Toplevel):
-    def __init__(self, master: tk.Tk, entry: StationEntry, on_saved=None) -> None:
+    def __init__(self, master: tk.Tk, entry: StationEntry, on_saved=None, can_save=None) -> None:
         super().__init__(master)
         self.entry = entry
         self.on_saved = on_saved
+        self.can_save = can_save
         self.title(f"手動訂正: {entry.callsign}")
         self.geometry("560x360")
         self.resizable(False, False)
@@ -2431,11 +3138,13 @@ class ManualEditDialog(tk.Toplevel):
         s = (s or "").strip().replace(",", "")
         if s == "":
             return None
-        if not re.fullmatch(r"\d+", s):
+        if not _RE_DIGITS.fullmatch(s):
             raise ValueError("数字のみ入力してください（空欄はOK）")
         return int(s)
 
     def _save(self) -> None:
+        if self.can_save is not None and not self.can_save():
+            return
         try:
             enabled = bool(self.enabled_var.get())
             qso = self._parse_opt_int(self.qso_var.get())
@@ -2456,7 +3165,7 @@ class ManualEditDialog(tk.Toplevel):
             recalc_entry(self.entry)
 
             if self.on_saved:
-                self.on_saved()
+                self.on_saved(self.entry)
             self.destroy()
         except Exception as ex:
             messagebox.showerror("入力エラー", str(ex))
@@ -2524,7 +3233,7 @@ class DetailWindow(tk.Toplevel):
 
         seen_mult = set()
         for q in entry.qsos:
-            ex = _canon_exchange(q.rcvd_exch)
+            ex = q.rcvd_exch_canon  # QSO 作成時に正規化済み
             is_new = False
             if (not q.dup) and q.pts > 0 and ex:
                 if ex not in seen_mult:
@@ -2552,4 +3261,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # exe化（PyInstaller等）した場合でも並列読込のワーカーが起動できるように
+    multiprocessing.freeze_support()
     main()